@@ -0,0 +1,54 @@
+# python backfill.py --season "XXXX-YY" ["XXXX-YY" ...] --season_type "Regular Season" "Playoffs" --workers 8 --rate 2 [--sync] [--latency_report]
+# python backfill.py --season "XXXX-YY" ["XXXX-YY" ...] --resume | --retry_dead_letters
+# python backfill.py --season "XXXX-YY" --workers 8 --queue_size 4 --stage_report 10
+# python backfill.py --season "XXXX-YY" --season_type "Regular Season" --league_date "m/dd/YYYY"
+# python backfill.py --season "XXXX-YY" --from_archive
+# python backfill.py --season "XXXX-YY" --revalidate 7
+# kill -USR1 <pid> prints per-endpoint latency histograms while a backfill is running
+import signal
+import time
+from helpers.backfill_utils import backfill_season
+from helpers.backfill_utils import ingest_league_date
+from helpers.backfill_utils import rebuild_from_archive
+from helpers.backfill_utils import revalidate_season
+from helpers.cli import parse_backfill_args
+from helpers.replay_utils import configure_replay
+from helpers.request_utils import STATS_RATE_LIMITER
+from helpers.request_utils import configure_requests
+from helpers.request_utils import dump_latency_histograms
+from helpers.shotchart_utils import SHOT_WAREHOUSE
+
+if __name__ == "__main__":
+    args = parse_backfill_args()
+    configure_replay(args)
+    configure_requests(timeout=args.timeout, retries=args.retries, pool_size=max(args.pool_size, args.workers))
+
+    if not SHOT_WAREHOUSE.available:
+        exit("ERROR: pyarrow is required to backfill the shot warehouse.")
+
+    # Share the requested rate across every worker thread
+    STATS_RATE_LIMITER.set_rate(args.rate, capacity=args.burst)
+
+    # Dump latency histograms on demand without stopping the run
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, dump_latency_histograms)
+
+    for season in args.season:
+        started = time.monotonic()
+        if args.from_archive:
+            rows = rebuild_from_archive(season, args.season_type)
+            print("Rebuilt {:,} shots from the archive in {:.1f}s.".format(rows, time.monotonic() - started))
+        elif args.revalidate:
+            games = revalidate_season(season, args.season_type, days=args.revalidate, max_workers=args.workers)
+            print("Corrected {} games in {:.1f}s.".format(games, time.monotonic() - started))
+        elif args.league_date:
+            ingest_league_date(season, args.season_type, args.league_date)
+            print("Pulled {} in {:.1f}s.".format(args.league_date, time.monotonic() - started))
+        else:
+            rows = backfill_season(season, args.season_type, max_workers=args.workers, incremental=args.sync,
+                                   resume=args.resume, retry_dead_letters=args.retry_dead_letters,
+                                   queue_size=args.queue_size, report_interval=args.stage_report)
+            print("Backfilled {:,} shots of {} in {:.1f}s.".format(rows, season, time.monotonic() - started))
+
+    if args.latency_report:
+        dump_latency_histograms()
@@ -0,0 +1,70 @@
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open."""
+    pass
+
+
+class CircuitBreaker:
+    """A thread-safe circuit breaker that fails fast after repeated errors.
+
+    The breaker opens after failure_threshold consecutive failures and rejects calls until
+    reset_timeout has passed. It then lets a single trial call through (half-open): a success
+    closes the breaker again, a failure re-opens it.
+    """
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        """Initialize a CircuitBreaker object.
+
+        Args:
+            name (str): Name of the protected endpoint, used in error messages.
+            failure_threshold (int, optional): Consecutive failures that open the breaker. Defaults to 5.
+            reset_timeout (float, optional): Seconds the breaker stays open before a trial call. Defaults to 30.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """The breaker state: 'closed', 'open' or 'half-open'."""
+        with self.lock:
+            if self.opened is None:
+                return "closed"
+            return "half-open" if time.monotonic() - self.opened >= self.reset_timeout else "open"
+
+    def before_call(self):
+        """Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a trial call already in flight.
+        """
+        with self.lock:
+            if self.opened is None:
+                return
+
+            remaining = self.reset_timeout - (time.monotonic() - self.opened)
+            if remaining > 0 or self.trial_in_flight:
+                raise CircuitOpenError("Circuit for {} is open; retry in {:.0f}s.".format(self.name, max(remaining, 0)))
+
+            self.trial_in_flight = True
+
+    def record_success(self):
+        """Record a successful call, closing the breaker."""
+        with self.lock:
+            self.failures = 0
+            self.opened = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        """Record a failed call, opening the breaker once the threshold is reached."""
+        with self.lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.opened is not None or self.failures >= self.failure_threshold:
+                self.opened = time.monotonic()
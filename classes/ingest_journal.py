@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+import time
+
+
+class IngestJournal:
+    """An append-only journal of bulk ingest units, used to resume runs and retry failures.
+
+    Every finished unit (team, season, season type and date range) is appended as one JSON line
+    with its status. The latest line of a unit wins: 'done' units are skipped when a run resumes,
+    and 'failed' units form the dead-letter list, which can be retried on its own.
+    """
+    def __init__(self, path: str):
+        """Initialize an IngestJournal object.
+
+        Args:
+            path (str): Path of the journal file.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_key(unit: dict) -> str:
+        """Build the key identifying a unit of work.
+
+        Args:
+            unit (dict): The unit's team_id, season, season_type, date_from and date_to.
+
+        Returns:
+            str: The unit's key.
+        """
+        return "|".join(str(unit.get(field) or "") for field in ("team_id", "season", "season_type", "date_from", "date_to"))
+
+    def record(self, unit: dict, status: str, rows: int = 0, error: str = None):
+        """Append a finished unit to the journal, durably.
+
+        Args:
+            unit (dict): The unit's team_id, season, season_type, date_from and date_to.
+            status (str): 'done' or 'failed'.
+            rows (int, optional): Number of shots ingested. Defaults to 0.
+            error (str, optional): Why the unit failed.
+        """
+        entry = {"unit": unit, "status": status, "rows": rows, "error": error, "at": time.time()}
+        line = json.dumps(entry, sort_keys=True) + "\n"
+
+        with self.lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def latest(self) -> dict:
+        """Get the latest journal entry of every unit, keyed by unit key.
+
+        A line left truncated by a crash is ignored.
+        """
+        entries = {}
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    entries[self.make_key(entry["unit"])] = entry
+        except FileNotFoundError:
+            pass
+
+        return entries
+
+    def completed(self) -> set:
+        """Get the keys of every unit whose latest status is 'done'."""
+        return {key for key, entry in self.latest().items() if entry["status"] == "done"}
+
+    def dead_letters(self) -> list:
+        """Get every unit whose latest status is 'failed', with its error."""
+        return [entry for entry in self.latest().values() if entry["status"] == "failed"]
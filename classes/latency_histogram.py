@@ -0,0 +1,73 @@
+import bisect
+import threading
+
+
+class LatencyHistogram:
+    """A thread-safe, fixed-bucket histogram of request latencies."""
+    # Upper bounds of the latency buckets in milliseconds (the last bucket is unbounded)
+    BUCKET_BOUNDS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+    def __init__(self, name: str):
+        """Initialize a LatencyHistogram object.
+
+        Args:
+            name (str): Name of the measured endpoint.
+        """
+        self.name = name
+        self.counts = [0] * (len(self.BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, seconds: float, error: bool = False):
+        """Record the latency of one request.
+
+        Args:
+            seconds (float): Latency of the request in seconds.
+            error (bool, optional): Whether the request failed. Defaults to False.
+        """
+        milliseconds = seconds * 1000
+        with self.lock:
+            self.counts[bisect.bisect_left(self.BUCKET_BOUNDS, milliseconds)] += 1
+            self.count += 1
+            self.errors += int(error)
+            self.total += milliseconds
+            self.max = max(self.max, milliseconds)
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a latency percentile as the upper bound of the bucket containing it.
+
+        Args:
+            percent (float): Percentile between 0 and 100.
+
+        Returns:
+            float: Estimated latency in milliseconds.
+        """
+        with self.lock:
+            rank = percent / 100 * self.count
+            seen = 0
+            for i, count in enumerate(self.counts):
+                seen += count
+                if count and seen >= rank:
+                    return self.BUCKET_BOUNDS[i] if i < len(self.BUCKET_BOUNDS) else self.max
+            return 0.0
+
+    def format(self) -> str:
+        """Format the histogram as a multi-line text report."""
+        if not self.count:
+            return "{}: no requests".format(self.name)
+
+        lines = ["{}: {} requests, {} errors, mean {:.0f}ms, p50 <= {:.0f}ms, p95 <= {:.0f}ms, p99 <= {:.0f}ms, max {:.0f}ms".format(
+            self.name, self.count, self.errors, self.total / self.count, self.percentile(50), self.percentile(95),
+            self.percentile(99), self.max)]
+
+        lower = 0
+        for bound, count in zip(self.BUCKET_BOUNDS + [None], self.counts):
+            if count:
+                label = "{}-{}ms".format(lower, bound) if bound else "{}ms+".format(lower)
+                lines.append("  {:>14} {:>7} {}".format(label, count, "#" * max(1, round(40 * count / self.count))))
+            lower = bound
+
+        return "\n".join(lines)
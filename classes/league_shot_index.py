@@ -0,0 +1,57 @@
+import pandas as pd
+from classes.shotchart import ShotChart
+
+
+class LeagueShotIndex:
+    """An in-memory index of a league-wide shot chart by team and player."""
+    def __init__(self, shotchart_df: pd.DataFrame):
+        """Initialize a LeagueShotIndex object.
+
+        Args:
+            shotchart_df (pd.DataFrame): DataFrame containing league-wide shot chart data.
+        """
+        self.df = shotchart_df.reset_index(drop=True)
+
+        # Row positions of each team's and each player's shots
+        self.team_rows = self.df.groupby('TEAM_ID', sort=False).indices if not self.df.empty else {}
+        self.player_rows = self.df.groupby('PLAYER_ID', sort=False).indices if not self.df.empty else {}
+
+    @property
+    def team_ids(self) -> list:
+        """IDs of every team with at least one shot."""
+        return list(self.team_rows.keys())
+
+    @property
+    def player_ids(self) -> list:
+        """IDs of every player with at least one shot."""
+        return list(self.player_rows.keys())
+
+    def team_shots(self, team_id: int) -> pd.DataFrame:
+        """Get every shot taken by a team.
+
+        Args:
+            team_id (int): The unique identifier of the team.
+
+        Returns:
+            pd.DataFrame: DataFrame of the team's shots. Empty if the team took none.
+        """
+        return self.df.iloc[self.team_rows.get(team_id, [])]
+
+    def player_shots(self, player_id: int) -> pd.DataFrame:
+        """Get every shot taken by a player.
+
+        Args:
+            player_id (int): The unique identifier of the player.
+
+        Returns:
+            pd.DataFrame: DataFrame of the player's shots. Empty if the player took none.
+        """
+        return self.df.iloc[self.player_rows.get(player_id, [])]
+
+    def team_shotchart(self, team_id: int) -> ShotChart:
+        """Build a team's ShotChart from the index."""
+        return ShotChart(shotchart_df=self.team_shots(team_id))
+
+    def player_shotchart(self, player_id: int) -> ShotChart:
+        """Build a player's ShotChart from the index."""
+        return ShotChart(shotchart_df=self.player_shots(player_id))
@@ -0,0 +1,132 @@
+import os
+import pickle
+import re
+import tempfile
+import threading
+import unicodedata
+from importlib import metadata
+
+# Punctuation dropped from names before indexing ("P.J." -> "pj", "D'Angelo" -> "dangelo")
+NAME_PUNCTUATION = re.compile(r"[.'’`]")
+
+
+class PlayerIndex:
+    """A persisted index of player records keyed by normalized full name.
+
+    Names are accent-stripped, case-folded and stripped of punctuation, so 'Nikola Jokic',
+    'nikola jokić' and 'NIKOLA JOKIĆ' resolve to the same player with one dictionary lookup. When
+    several players share a name, active players rank first and then the most recent (highest id),
+    so the same name always resolves to the same player.
+
+    The index is built from nba_api's static player list on first use and persisted; the persisted
+    copy is rebuilt whenever the installed nba_api version changes.
+    """
+    def __init__(self, index_path: str = None, players: list = None):
+        """Initialize a PlayerIndex object.
+
+        Args:
+            index_path (str, optional): Path of the persisted index. Defaults to an in-memory index.
+            players (list, optional): Player records to index. Defaults to nba_api's static player list.
+        """
+        self.index_path = index_path
+        self.players = players
+        self.names = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalize a name for lookup: strip accents and punctuation, case-fold and collapse whitespace."""
+        decomposed = unicodedata.normalize("NFKD", name)
+        stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return " ".join(NAME_PUNCTUATION.sub("", stripped).replace("-", " ").casefold().split())
+
+    @staticmethod
+    def get_source_version() -> str:
+        """Get the version of the static player list, i.e. the installed nba_api version."""
+        try:
+            return metadata.version("nba_api")
+        except metadata.PackageNotFoundError:
+            return None
+
+    def load(self):
+        """Load the persisted index, or build (and persist) it if it is missing or stale."""
+        with self.lock:
+            if self.names is not None:
+                return
+
+            if self.players is None and self.index_path:
+                try:
+                    with open(self.index_path, "rb") as f:
+                        index = pickle.load(f)
+                    if index["source"] == self.get_source_version():
+                        self.names = index["names"]
+                        return
+                except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+                    pass
+
+            self.names = self.build(self.players)
+            if self.players is None and self.index_path:
+                self.save()
+
+    def build(self, players: list = None) -> dict:
+        """Build the name index.
+
+        Args:
+            players (list, optional): Player records to index. Defaults to nba_api's static player list.
+
+        Returns:
+            dict: Normalized name -> player records, best match first.
+        """
+        if players is None:
+            from nba_api.stats.static import players as static_players
+            players = static_players.get_players()
+
+        names = {}
+        for player in players:
+            names.setdefault(self.normalize(player["full_name"]), []).append(player)
+
+        # Ambiguous names: active players first, then the most recent player
+        for records in names.values():
+            records.sort(key=lambda player: (not player.get("is_active"), -player["id"]))
+
+        return names
+
+    def save(self):
+        """Persist the index atomically."""
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.index_path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"source": self.get_source_version(), "names": self.names}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.index_path)
+
+    def get(self, name: str) -> dict:
+        """Get the player with a name, resolving ambiguous names deterministically.
+
+        Args:
+            name (str): Full name of the player, in any case and with or without accents.
+
+        Returns:
+            dict: The player's record, or None if no player has the name.
+        """
+        records = self.get_all(name)
+        return records[0] if records else None
+
+    def get_all(self, name: str) -> list:
+        """Get every player with a name, best match first."""
+        if self.names is None:
+            self.load()
+        return self.names.get(self.normalize(name), [])
+
+    def resolve_many(self, names: list) -> dict:
+        """Resolve many names at once.
+
+        Args:
+            names (list): Full names of players.
+
+        Returns:
+            dict: Each name -> the player's record, or None if no player has the name.
+        """
+        if self.names is None:
+            self.load()
+        return {name: self.get(name) for name in names}
@@ -0,0 +1,49 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """A thread-safe token-bucket rate limiter shared by every request to the stats API."""
+    def __init__(self, rate: float, capacity: int = 1):
+        """Initialize a TokenBucket object.
+
+        Args:
+            rate (float): Tokens added per second, i.e. the sustained request rate.
+            capacity (int, optional): Maximum number of tokens, i.e. the allowed burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def set_rate(self, rate: float, capacity: int = None):
+        """Change the sustained rate and, optionally, the burst size of the bucket."""
+        with self.lock:
+            self.refill()
+            self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+                self.tokens = min(self.tokens, capacity)
+
+    def refill(self):
+        """Add the tokens accumulated since the last update. Callers must hold the lock."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: int = 1):
+        """Block until the requested number of tokens is available, then consume them.
+
+        Args:
+            tokens (int, optional): Number of tokens to consume. Defaults to 1.
+        """
+        while True:
+            with self.lock:
+                self.refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait)
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+
+
+class ResponseArchive:
+    """A content-addressed, compressed archive of raw stats API responses.
+
+    Every response body is stored once under its SHA-256 digest as a zlib-compressed blob
+    ('objects/<ab>/<digest>.z'), so identical payloads (e.g. re-fetches of unchanged games) share
+    one blob. An append-only index ('index.jsonl') records which request produced which digest.
+    """
+    def __init__(self, archive_dir: str, level: int = 6):
+        """Initialize a ResponseArchive object.
+
+        Args:
+            archive_dir (str): Directory in which the archive is stored.
+            level (int, optional): zlib compression level of new blobs. Defaults to 6.
+        """
+        self.archive_dir = archive_dir
+        self.level = level
+        self.lock = threading.Lock()
+
+    @property
+    def index_path(self) -> str:
+        """Path of the append-only request index."""
+        return os.path.join(self.archive_dir, "index.jsonl")
+
+    def get_object_path(self, digest: str) -> str:
+        """Get the on-disk path of a blob."""
+        return os.path.join(self.archive_dir, "objects", digest[:2], digest + ".z")
+
+    def has(self, digest: str) -> bool:
+        """Check whether a blob is stored."""
+        return os.path.exists(self.get_object_path(digest))
+
+    def put(self, endpoint: str, params: dict, body: str) -> str:
+        """Archive a raw response body and index the request that produced it.
+
+        Args:
+            endpoint (str): Name of the stats API endpoint.
+            params (dict): Request parameters exactly as sent.
+            body (str): Raw response body.
+
+        Returns:
+            str: Hex SHA-256 digest of the body.
+        """
+        data = body.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        # Only new content is compressed and written; duplicates just get an index entry
+        path = self.get_object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(data, self.level))
+            os.replace(tmp_path, path)
+
+        entry = {"digest": digest, "endpoint": endpoint, "params": params, "size": len(data), "archived": time.time()}
+        with self.lock:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry, sort_keys=True) + "\n")
+
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Get an archived response body.
+
+        Args:
+            digest (str): Hex SHA-256 digest of the body.
+
+        Returns:
+            str: The raw response body.
+
+        Raises:
+            FileNotFoundError: If no blob is stored under the digest.
+        """
+        with open(self.get_object_path(digest), "rb") as f:
+            return zlib.decompress(f.read()).decode("utf-8")
+
+    def entries(self, endpoint: str = None, latest: bool = True) -> list:
+        """List indexed requests, oldest first.
+
+        Args:
+            endpoint (str, optional): Only list requests to this endpoint.
+            latest (bool, optional): Keep only the most recent entry of each distinct request. Defaults to True.
+
+        Returns:
+            list: Index entries (digest, endpoint, params, size, archived).
+        """
+        try:
+            with open(self.index_path) as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+        if endpoint is not None:
+            entries = [entry for entry in entries if entry["endpoint"] == endpoint]
+
+        if latest:
+            requests = {}
+            for entry in entries:
+                key = (entry["endpoint"], json.dumps(entry["params"], sort_keys=True))
+                requests.pop(key, None)
+                requests[key] = entry
+            entries = list(requests.values())
+
+        return entries
+
+    def stats(self) -> dict:
+        """Summarize the archive: indexed requests, distinct blobs, raw and stored bytes."""
+        entries = self.entries(latest=False)
+        sizes = {entry["digest"]: entry["size"] for entry in entries}
+        stored = sum(os.path.getsize(self.get_object_path(digest)) for digest in sizes if self.has(digest))
+
+        return {"requests": len(entries), "objects": len(sizes), "raw_bytes": sum(entry["size"] for entry in entries),
+                "unique_bytes": sum(sizes.values()), "stored_bytes": stored}
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+import pandas as pd
+
+
+class ShotCache:
+    """A disk-backed, size-bounded LRU cache for shot chart DataFrames and processed ShotCharts."""
+    def __init__(self, cache_dir: str, ttl: float = 3600, max_bytes: int = 512 * 1024 * 1024):
+        """Initialize a ShotCache object.
+
+        Args:
+            cache_dir (str): Directory in which cache entries are stored.
+            ttl (float, optional): Default time-to-live of an entry in seconds. None never expires.
+            max_bytes (int, optional): Maximum total size of the cache on disk before LRU eviction.
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    def make_key(self, params: dict) -> str:
+        """Build a stable cache key from the full request parameter set.
+
+        Args:
+            params (dict): Request parameters (player_id, team_id, season, season_type, date, ...).
+
+        Returns:
+            str: Hex digest identifying the parameter set.
+        """
+        encoded = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+    def get_path(self, key: str) -> str:
+        """Get the on-disk path of a cache entry."""
+        return os.path.join(self.cache_dir, key + ".pkl")
+
+    def get(self, params: dict) -> pd.DataFrame:
+        """Get a cached DataFrame for the given parameters.
+
+        Reading an entry refreshes its access time, which drives LRU eviction.
+
+        Args:
+            params (dict): Request parameters used as the cache key.
+
+        Returns:
+            pd.DataFrame: The cached DataFrame, or None on a miss or an expired entry.
+        """
+        path = self.get_path(self.make_key(params))
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+
+                # Drop expired entries without deserializing their data
+                if entry["expires"] is not None and entry["expires"] < time.time():
+                    f.close()
+                    self.delete(params)
+                    return None
+
+                data = entry["data"] if "data" in entry else pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # Mark entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return data
+
+    def set(self, params: dict, data: pd.DataFrame, ttl: float = -1):
+        """Store a DataFrame in the cache and evict least recently used entries if over capacity.
+
+        Args:
+            params (dict): Request parameters used as the cache key.
+            data (pd.DataFrame): DataFrame to cache.
+            ttl (float, optional): Time-to-live in seconds. None never expires. Defaults to the cache TTL.
+        """
+        ttl = self.ttl if ttl == -1 else ttl
+        header = {
+            "params": params,
+            "created": time.time(),
+            "expires": None if ttl is None else time.time() + ttl
+        }
+
+        # Write atomically so concurrent readers never see a partial entry. The header is pickled
+        # ahead of the data so it can be read without loading the data.
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.get_path(self.make_key(params)))
+
+        self.evict()
+
+    def delete(self, params: dict):
+        """Remove the cache entry for the given parameters, if present."""
+        try:
+            os.remove(self.get_path(self.make_key(params)))
+        except OSError:
+            pass
+
+    def invalidate(self, predicate) -> int:
+        """Remove every entry whose request parameters match a predicate.
+
+        Only entry headers are read, so invalidating a large cache never deserializes its data.
+
+        Args:
+            predicate (callable): Called with an entry's params; True removes the entry.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pkl"):
+                continue
+
+            path = os.path.join(self.cache_dir, name)
+            try:
+                with open(path, "rb") as f:
+                    params = pickle.load(f)["params"]
+            except (OSError, EOFError, pickle.UnpicklingError):
+                continue
+
+            if predicate(params):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+
+        return removed
+
+    def evict(self):
+        """Evict least recently used entries until the cache fits within max_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pkl"):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+            total_bytes -= size
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.cache_dir, name))
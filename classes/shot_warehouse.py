@@ -0,0 +1,397 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+import pandas as pd
+from urllib.parse import quote
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = ds = pq = None
+
+
+class ShotWarehouse:
+    """A local columnar store of shots, stored as Parquet partitioned by season, season type and team."""
+    PARTITION_COLUMNS = ["SEASON", "SEASON_TYPE", "TEAM_ID"]
+
+    # Files a partition may hold before a write compacts it into one
+    MAX_PARTITION_FILES = 8
+
+    def __init__(self, root: str):
+        """Initialize a ShotWarehouse object.
+
+        Args:
+            root (str): Root directory of the partitioned Parquet dataset.
+        """
+        self.root = root
+        self.watermarks_path = os.path.join(root, "_watermarks.json")
+        self.game_hashes_path = os.path.join(root, "_game_hashes.json")
+        self.lock = threading.Lock()
+        self.partition_locks = {}
+
+    @property
+    def available(self) -> bool:
+        """Whether the Parquet engine (pyarrow) is installed."""
+        return pa is not None
+
+    # Categorical shot columns, stored as dictionary-encoded Parquet strings and read back as categoricals
+    CATEGORICAL_COLUMNS = ["GRID_TYPE", "GAME_ID", "PLAYER_NAME", "TEAM_NAME", "EVENT_TYPE", "ACTION_TYPE", "SHOT_TYPE",
+                           "SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "SHOT_ZONE_RANGE", "HTM", "VTM"]
+
+    @property
+    def schema(self) -> "pa.Schema":
+        """Arrow schema of the shot columns stored in each partition file."""
+        return pa.schema([
+            ("GRID_TYPE", pa.string()),
+            ("GAME_ID", pa.string()),
+            ("GAME_EVENT_ID", pa.int32()),
+            ("PLAYER_ID", pa.int32()),
+            ("PLAYER_NAME", pa.string()),
+            ("TEAM_NAME", pa.string()),
+            ("PERIOD", pa.int8()),
+            ("MINUTES_REMAINING", pa.int8()),
+            ("SECONDS_REMAINING", pa.int8()),
+            ("EVENT_TYPE", pa.string()),
+            ("ACTION_TYPE", pa.string()),
+            ("SHOT_TYPE", pa.string()),
+            ("SHOT_ZONE_BASIC", pa.string()),
+            ("SHOT_ZONE_AREA", pa.string()),
+            ("SHOT_ZONE_RANGE", pa.string()),
+            ("SHOT_DISTANCE", pa.int16()),
+            ("LOC_X", pa.int16()),
+            ("LOC_Y", pa.int16()),
+            ("SHOT_ATTEMPTED_FLAG", pa.int8()),
+            ("SHOT_MADE_FLAG", pa.int8()),
+            ("GAME_DATE", pa.timestamp("ns")),
+            ("HTM", pa.string()),
+            ("VTM", pa.string())
+        ])
+
+    @property
+    def columns(self) -> list:
+        """Shot columns in the order of a ShotChartDetail frame; TEAM_ID is read back from the partition path."""
+        names = self.schema.names
+        position = names.index("TEAM_NAME")
+        return names[:position] + ["TEAM_ID"] + names[position:]
+
+    def get_partition_path(self, season: str, season_type: str, team_id: int) -> str:
+        """Get the directory of a (season, season_type, team) partition."""
+        return os.path.join(self.root,
+                            "SEASON={}".format(quote(season, safe="")),
+                            "SEASON_TYPE={}".format(quote(season_type, safe="")),
+                            "TEAM_ID={}".format(team_id))
+
+    def has_partition(self, season: str, season_type: str, team_id: int) -> bool:
+        """Check whether any shots are stored for a (season, season_type, team) partition."""
+        return os.path.isdir(self.get_partition_path(season, season_type, team_id))
+
+    def get_partition_lock(self, partition_path: str) -> threading.Lock:
+        """Get the lock serializing writes to a partition."""
+        with self.lock:
+            return self.partition_locks.setdefault(partition_path, threading.Lock())
+
+    def get_partition_files(self, partition_path: str) -> list:
+        """Get the Parquet files of a partition, skipping files still being written."""
+        try:
+            return [os.path.join(partition_path, name) for name in sorted(os.listdir(partition_path))
+                    if name.endswith(".parquet") and not name.startswith(("_", "."))]
+        except FileNotFoundError:
+            return []
+
+    def get_team_ids(self, season: str, season_type: str) -> list:
+        """Get the IDs of every team with shots stored for a (season, season_type)."""
+        season_type_path = os.path.dirname(self.get_partition_path(season, season_type, 0))
+        try:
+            return sorted(int(name.split("=", 1)[1]) for name in os.listdir(season_type_path)
+                          if name.startswith("TEAM_ID="))
+        except FileNotFoundError:
+            return []
+
+    def get_dataset(self, files: list) -> "ds.Dataset":
+        """Open partition files as a hive-partitioned Arrow dataset.
+
+        Only the given files are opened, so a lookup never lists the rest of the warehouse.
+
+        Args:
+            files (list): Paths of the Parquet files, inside their partition directories.
+        """
+        partition_schema = pa.schema([("SEASON", pa.string()), ("SEASON_TYPE", pa.string()), ("TEAM_ID", pa.int32())])
+
+        # Read categorical columns straight into dictionary arrays (pandas categoricals)
+        read_schema = pa.schema([pa.field(field.name, pa.dictionary(pa.int32(), pa.string()))
+                                 if field.name in self.CATEGORICAL_COLUMNS else field for field in self.schema])
+        file_format = ds.ParquetFileFormat(read_options=ds.ParquetReadOptions(dictionary_columns=self.CATEGORICAL_COLUMNS))
+
+        return ds.dataset(files, format=file_format,
+                          schema=pa.unify_schemas([read_schema, partition_schema]),
+                          partitioning=ds.partitioning(partition_schema, flavor="hive"),
+                          partition_base_dir=self.root)
+
+    def read(self, season: str, season_type, team_id: int=None, columns: list=None, date_from: str=None,
+             date_to: str=None, player_id: int=None, period: int=None) -> pd.DataFrame:
+        """Read shots from the warehouse, pushing projections and filters down to the Parquet scan.
+
+        Args:
+            season (str): The season in which the games were played.
+            season_type (str | list): One or more season types.
+            team_id (int, optional): The unique identifier of the team. Defaults to every team.
+            columns (list, optional): Columns to read. Defaults to every shot column, in the order and
+                dtypes of a ShotChartDetail frame; SEASON and SEASON_TYPE are only read when requested.
+            date_from (str, optional): Earliest game date in the format 'YYYYMMDD'.
+            date_to (str, optional): Latest game date in the format 'YYYYMMDD'.
+            player_id (int, optional): The unique identifier of the player. Defaults to every player.
+            period (int, optional): The period in which the shots were taken. Defaults to every period.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the matching shots. Empty if nothing is stored.
+        """
+        season_types = [season_type] if isinstance(season_type, str) else list(season_type)
+        columns = columns or self.columns
+
+        # Open only the requested partitions; column filters are pushed into the row-group scan
+        files = [path for season_type in season_types
+                 for partition_team_id in ([team_id] if team_id else self.get_team_ids(season, season_type))
+                 for path in self.get_partition_files(self.get_partition_path(season, season_type, partition_team_id))]
+        if not files:
+            return pd.DataFrame(columns=columns)
+
+        expression = ds.scalar(True)
+        if date_from:
+            expression &= ds.field("GAME_DATE") >= pd.Timestamp(date_from).to_pydatetime()
+        if date_to:
+            expression &= ds.field("GAME_DATE") <= pd.Timestamp(date_to).to_pydatetime()
+        if player_id:
+            expression &= ds.field("PLAYER_ID") == player_id
+        if period:
+            expression &= ds.field("PERIOD") == period
+
+        table = self.get_dataset(files).to_table(columns=columns, filter=expression)
+        return table.to_pandas()
+
+    def write(self, shotchart_df: pd.DataFrame, season: str, season_type: str) -> int:
+        """Append shots to the warehouse, one file per team partition.
+
+        Games already stored in a partition are skipped, so re-ingesting overlapping date ranges
+        never duplicates shots. A partition holding more than MAX_PARTITION_FILES files after the
+        append is compacted into a single file.
+
+        Args:
+            shotchart_df (pd.DataFrame): DataFrame of shots returned by the ShotChartDetail endpoint.
+            season (str): The season in which the games were played.
+            season_type (str): The type of season of the shots.
+
+        Returns:
+            int: Number of shots written.
+        """
+        written = 0
+        for team_id, team_df in shotchart_df.groupby("TEAM_ID"):
+            partition_path = self.get_partition_path(season, season_type, int(team_id))
+
+            with self.get_partition_lock(partition_path):
+                # Skip games already stored in this partition
+                files = self.get_partition_files(partition_path)
+                if files:
+                    stored_games = ds.dataset(files, schema=self.schema, format="parquet").to_table(columns=["GAME_ID"])
+                    team_df = team_df[~team_df["GAME_ID"].astype(str).isin(set(stored_games.column("GAME_ID").to_pylist()))]
+                if team_df.empty:
+                    continue
+
+                table = pa.Table.from_pandas(team_df.reindex(columns=self.schema.names), schema=self.schema,
+                                             preserve_index=False)
+
+                if len(files) >= self.MAX_PARTITION_FILES:
+                    # Compact the partition's small appended files together with the new shots
+                    table = pa.concat_tables([ds.dataset(files, schema=self.schema, format="parquet").to_table(), table])
+                    self.rewrite_partition(partition_path, table, files)
+                else:
+                    os.makedirs(partition_path, exist_ok=True)
+                    pq.write_table(table, os.path.join(partition_path, "part-{}.parquet".format(uuid.uuid4().hex)))
+            written += len(team_df)
+
+            self.set_game_hashes(season, season_type, int(team_id), self.hash_games(team_df))
+
+        return written
+
+    def replace_games(self, shotchart_df: pd.DataFrame, season: str, season_type: str) -> int:
+        """Replace the stored shots of whole games, e.g. after the league corrected them.
+
+        Each affected team partition is rewritten as a single file holding its untouched games and the
+        replacement games; partitions without replaced games are left alone.
+
+        Args:
+            shotchart_df (pd.DataFrame): Every shot of the games to replace, as returned by ShotChartDetail.
+            season (str): The season in which the games were played.
+            season_type (str): The type of season of the shots.
+
+        Returns:
+            int: Number of shots written.
+        """
+        written = 0
+        for team_id, team_df in shotchart_df.groupby("TEAM_ID"):
+            partition_path = self.get_partition_path(season, season_type, int(team_id))
+
+            with self.get_partition_lock(partition_path):
+                old_files = self.get_partition_files(partition_path)
+
+                # Keep every other game of the partition
+                table = pa.Table.from_pandas(team_df.reindex(columns=self.schema.names), schema=self.schema,
+                                             preserve_index=False)
+                if old_files:
+                    kept = ds.dataset(old_files, schema=self.schema, format="parquet").to_table(
+                        filter=~ds.field("GAME_ID").isin(team_df["GAME_ID"].astype(str).unique().tolist()))
+                    table = pa.concat_tables([kept, table])
+
+                self.rewrite_partition(partition_path, table, old_files)
+            written += len(team_df)
+
+            self.set_game_hashes(season, season_type, int(team_id), self.hash_games(team_df))
+
+        return written
+
+    def rewrite_partition(self, partition_path: str, table: "pa.Table", old_files: list):
+        """Replace a partition's files with one file holding a table. Callers must hold the partition lock.
+
+        Args:
+            partition_path (str): Directory of the partition.
+            table (pa.Table): Every shot the partition should hold.
+            old_files (list): The partition's current files, removed once the new file is in place.
+        """
+        # Write the new file under an ignored name first, so readers never see a partial file
+        os.makedirs(partition_path, exist_ok=True)
+        name = "part-{}.parquet".format(uuid.uuid4().hex)
+        pq.write_table(table, os.path.join(partition_path, "_" + name))
+        os.replace(os.path.join(partition_path, "_" + name), os.path.join(partition_path, name))
+        for path in old_files:
+            os.remove(path)
+
+    def hash_games(self, shotchart_df: pd.DataFrame) -> dict:
+        """Fingerprint each game's shots, independent of row order and column dtypes.
+
+        Args:
+            shotchart_df (pd.DataFrame): Every shot of one or more games, with every stored column.
+
+        Returns:
+            dict: Hex SHA-1 digest of each game's shots, keyed by GAME_ID.
+        """
+        hashes = {}
+        for game_id, game_df in shotchart_df.groupby("GAME_ID", sort=False, observed=True):
+            game_df = game_df.reindex(columns=self.schema.names).sort_values(["GAME_EVENT_ID", "PLAYER_ID"])
+            canonical = game_df.astype(str)
+            row_hashes = pd.util.hash_pandas_object(canonical, index=False).values
+            hashes[str(game_id)] = hashlib.sha1(row_hashes.tobytes()).hexdigest()
+
+        return hashes
+
+    def get_game_hashes(self, season: str, season_type: str, team_id: int) -> dict:
+        """Get the fingerprint of every game stored for a (season, season_type, team).
+
+        Games stored before fingerprints were recorded are fingerprinted from their stored shots.
+
+        Args:
+            season (str): The season of the games.
+            season_type (str): The type of season of the games.
+            team_id (int): The unique identifier of the team.
+
+        Returns:
+            dict: Hex digest of each stored game's shots, keyed by GAME_ID.
+        """
+        with self.lock:
+            hashes = self.read_json(self.game_hashes_path).get("|".join([season, season_type, str(team_id)]), {})
+
+        if self.has_partition(season, season_type, team_id):
+            stored_df = self.read(season, season_type, team_id=team_id)
+            missing_df = stored_df[~stored_df["GAME_ID"].astype(str).isin(set(hashes))]
+            if not missing_df.empty:
+                missing = self.hash_games(missing_df)
+                self.set_game_hashes(season, season_type, team_id, missing)
+                hashes.update(missing)
+
+        return hashes
+
+    def set_game_hashes(self, season: str, season_type: str, team_id: int, hashes: dict):
+        """Record the fingerprints of games stored for a (season, season_type, team).
+
+        Args:
+            season (str): The season of the games.
+            season_type (str): The type of season of the games.
+            team_id (int): The unique identifier of the team.
+            hashes (dict): Hex digest of each game's shots, keyed by GAME_ID.
+        """
+        with self.lock:
+            game_hashes = self.read_json(self.game_hashes_path)
+            game_hashes.setdefault("|".join([season, season_type, str(team_id)]), {}).update(hashes)
+            self.write_json(self.game_hashes_path, game_hashes)
+
+    def get_watermark(self, season: str, season_type: str, team_id: int) -> dict:
+        """Get the latest game ingested for a (season, season_type, team) by backfill or sync.
+
+        Args:
+            season (str): The season of the games.
+            season_type (str): The type of season of the games.
+            team_id (int): The unique identifier of the team.
+
+        Returns:
+            dict: The 'GAME_DATE' ('YYYYMMDD') and 'GAME_ID' of the latest game, or None if never ingested.
+        """
+        with self.lock:
+            return self.read_watermarks().get("|".join([season, season_type, str(team_id)]))
+
+    def set_watermark(self, season: str, season_type: str, team_id: int, game_date: str, game_id: str):
+        """Record the latest game ingested for a (season, season_type, team).
+
+        Args:
+            season (str): The season of the games.
+            season_type (str): The type of season of the games.
+            team_id (int): The unique identifier of the team.
+            game_date (str): Date of the latest game in the format 'YYYYMMDD'.
+            game_id (str): The unique identifier of the latest game.
+        """
+        with self.lock:
+            watermarks = self.read_watermarks()
+            watermarks["|".join([season, season_type, str(team_id)])] = {"GAME_DATE": game_date, "GAME_ID": game_id}
+            self.write_json(self.watermarks_path, watermarks)
+
+    def covers(self, season: str, season_type, team_id: int, date_to: str) -> bool:
+        """Check whether backfill or sync ingested every game of a team up to a date.
+
+        Args:
+            season (str): The season of the games.
+            season_type (str | list): One or more season types.
+            team_id (int): The unique identifier of the team.
+            date_to (str): Latest game date in the format 'YYYYMMDD'.
+
+        Returns:
+            bool: True if every season type's watermark is on or after date_to.
+        """
+        season_types = [season_type] if isinstance(season_type, str) else list(season_type)
+        for season_type in season_types:
+            watermark = self.get_watermark(season, season_type, team_id)
+            if not watermark or watermark["GAME_DATE"] < date_to:
+                return False
+
+        return True
+
+    def read_watermarks(self) -> dict:
+        """Read every recorded watermark. Callers must hold the lock."""
+        return self.read_json(self.watermarks_path)
+
+    def read_json(self, path: str) -> dict:
+        """Read a metadata file of the warehouse. Callers must hold the lock."""
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def write_json(self, path: str, data: dict):
+        """Write a metadata file of the warehouse. Callers must hold the lock."""
+        # Replace atomically so a crash never leaves a truncated file behind
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
@@ -4,12 +4,15 @@ import math
 import pandas as pd
 import sys
 from collections import OrderedDict
-from datetime import datetime
 from enums.court_dimensions import CourtDimensions
 
 
 class ShotChart:
     """A class representing a shot chart with various statistics and breakdowns."""
+    # Shot columns required to process and plot a shot chart
+    COLUMNS = ['GAME_ID', 'GAME_DATE', 'PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_NAME', 'PERIOD', 'EVENT_TYPE',
+               'ACTION_TYPE', 'SHOT_TYPE', 'SHOT_DISTANCE', 'LOC_X', 'LOC_Y', 'SHOT_ATTEMPTED_FLAG', 'SHOT_MADE_FLAG']
+
     def __init__(self, shotchart_df: pd.DataFrame = None):
         """Initialize a ShotChart object.
 
@@ -44,6 +47,9 @@ class ShotChart:
         self.top_of_key_3 = dict.fromkeys(field_goal_keys, 0)
         self.straight_deep_3 = dict.fromkeys(field_goal_keys, 0)
 
+        # Aggregates already processed, so a cached chart is never processed twice
+        self.processed = set()
+
         # Initialize shot chart member dictionaries
         self.shot_chart_data = {
             "points": {},
@@ -68,22 +74,30 @@ class ShotChart:
         """
         if isinstance(self.df, pd.DataFrame) and not self.df.empty:
             # Game Date
-            self.game_date = datetime.strptime(str(self.df.iloc[0]['GAME_DATE']), '%Y%m%d')
+            self.game_date = pd.Timestamp(self.df.iloc[0]['GAME_DATE']).to_pydatetime()
+
+            # Skip aggregates that were already processed (e.g. precomputed by the prefetch daemon)
+            requested = {name for name, flag in [("points", points), ("zones", zones), ("types", shot_type),
+                                                 ("distances", shot_distances), ("periods", shot_periods),
+                                                 ("breakdowns", shot_breakdown)] if flag}
+            requested -= self.processed
 
             # Process shot statistics if corresponding flags are True
-            if points:
+            if "points" in requested:
                 self.process_shots_by_points(self.shot_chart_data["points"])
-            if zones:
+            if "zones" in requested:
                 self.process_shots_by_zones()
-            if shot_type:
+            if "types" in requested:
                 self.process_shots_by_type(self.shot_chart_data["types"])
-            if shot_distances:
+            if "distances" in requested:
                 self.process_shots_by_distance(self.shot_chart_data["distances"])
-            if shot_periods:
+            if "periods" in requested:
                 self.process_shots_by_period(self.shot_chart_data["periods"])
-            if shot_breakdown:
+            if "breakdowns" in requested:
                 self.process_shots_by_breakdown(self.shot_chart_data["breakdowns"])
 
+            self.processed |= requested
+
     def process_shots_by_points(self, points_dict) -> dict:
         """Process shot statistics by points based on the provided DataFrame."""
         for index, row in self.df.iterrows():
@@ -380,6 +394,9 @@ class ShotChart:
             total_shots (int): The total number of shots.
         """
         for key in shots_dict.keys():
+            # Buckets without any shots (e.g. a period a player never shot in) hold zeroed statistics
+            if not isinstance(shots_dict[key], dict):
+                shots_dict[key] = dict.fromkeys(["made", "missed", "attempted", "percent", "frequency"], 0)
             shots_dict[key]["frequency"] = shots_dict[key]["attempted"] / total_shots
 
     def is_shot_inside_3pt_arc(self, x: float, y: float, start_angle: float, end_angle: float) -> bool:
@@ -0,0 +1,46 @@
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls so only one is in flight and every caller shares its result."""
+    def __init__(self):
+        """Initialize a SingleFlight object."""
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def do(self, key: str, fn, *args, **kwargs):
+        """Call fn, or wait for the in-flight call with the same key and share its result.
+
+        The first caller for a key runs fn; callers arriving while it is running block until it
+        finishes and receive the same result (or exception). Once the call completes the key is
+        released, so later calls run fn again.
+
+        Args:
+            key (str): Identifies identical calls.
+            fn (callable): Function to call.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            The result of the (possibly shared) call.
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self.calls[key] = call
+
+        if not leader:
+            return call.result()
+
+        try:
+            call.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            call.set_exception(e)
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+        return call.result()
@@ -0,0 +1,189 @@
+import queue
+import threading
+import time
+
+# Marks the end of a stage's input
+END_OF_INPUT = object()
+
+
+class PipelineStage:
+    """A pipeline stage: worker threads reading from a bounded input queue."""
+    def __init__(self, name: str, fn, workers: int, queue_size: int):
+        """Initialize a PipelineStage object.
+
+        Args:
+            name (str): Name of the stage, used in stats.
+            fn (callable): Called as fn(item, payload) and returns the payload for the next stage.
+            workers (int): Number of worker threads.
+            queue_size (int): Capacity of the stage's input queue.
+        """
+        self.name = name
+        self.fn = fn
+        self.workers = workers
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.processed = 0
+        self.failed = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self.max_depth = 0
+        self.running = workers
+        self.lock = threading.Lock()
+
+    def put(self, entry):
+        """Put an entry on the stage's input queue, recording its depth."""
+        self.queue.put(entry)
+        with self.lock:
+            self.max_depth = max(self.max_depth, self.queue.qsize())
+
+
+class StagedPipeline:
+    """A pipeline of concurrent stages connected by bounded queues.
+
+    Each item (e.g. an ingest unit) flows through every stage in order, carrying the payload the
+    previous stage returned. A full queue blocks the stage feeding it, so a slow stage throttles
+    every stage upstream instead of letting payloads pile up in memory. Each stage tracks its
+    throughput, utilization, time blocked on the next queue and queue depth.
+    """
+    def __init__(self, stages: list, queue_size: int = 4, on_complete=None, on_error=None):
+        """Initialize a StagedPipeline object.
+
+        Args:
+            stages (list): (name, fn, workers) tuples, in order. fn(item, payload) returns the next payload.
+            queue_size (int, optional): Capacity of every stage's input queue. Defaults to 4.
+            on_complete (callable, optional): Called as on_complete(item, payload) with the last stage's result.
+                An exception it raises fails the item, which is passed to on_error.
+            on_error (callable, optional): Called as on_error(item, stage_name, exception) when a stage fails.
+        """
+        self.stages = [PipelineStage(name, fn, workers, queue_size) for name, fn, workers in stages]
+        self.on_complete = on_complete
+        self.on_error = on_error
+        self.started = None
+
+    def run(self, items, report_interval: float = None):
+        """Push every item through the pipeline and wait for all of them to finish.
+
+        Args:
+            items (iterable): Items to process.
+            report_interval (float, optional): Seconds between printed stats reports. Defaults to none.
+        """
+        self.started = time.monotonic()
+        threads = [threading.Thread(target=self.work, args=(i,), daemon=True)
+                   for i, stage in enumerate(self.stages) for _ in range(stage.workers)]
+        for thread in threads:
+            thread.start()
+
+        done = threading.Event()
+        if report_interval:
+            threading.Thread(target=self.report, args=(report_interval, done), daemon=True).start()
+
+        # Feeding blocks while the first stage's queue is full
+        first = self.stages[0]
+        for item in items:
+            first.put((item, None))
+        for _ in range(first.workers):
+            first.put(END_OF_INPUT)
+
+        for thread in threads:
+            thread.join()
+        done.set()
+
+    def work(self, index: int):
+        """Process entries of one stage until its input ends."""
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        while True:
+            entry = stage.queue.get()
+            if entry is END_OF_INPUT:
+                break
+
+            item, payload = entry
+            started = time.monotonic()
+            try:
+                payload = stage.fn(item, payload)
+            except Exception as e:
+                with stage.lock:
+                    stage.failed += 1
+                    stage.busy += time.monotonic() - started
+                self.report_error(item, stage, e)
+                continue
+
+            with stage.lock:
+                stage.processed += 1
+                stage.busy += time.monotonic() - started
+
+            if next_stage is None:
+                if self.on_complete:
+                    # A failing callback (e.g. a journal write) fails the item, not the worker
+                    try:
+                        self.on_complete(item, payload)
+                    except Exception as e:
+                        with stage.lock:
+                            stage.processed -= 1
+                            stage.failed += 1
+                        self.report_error(item, stage, e)
+                continue
+
+            # Blocks while the next stage is behind (backpressure)
+            blocked = time.monotonic()
+            next_stage.put((item, payload))
+            with stage.lock:
+                stage.blocked += time.monotonic() - blocked
+
+        # The last worker of a stage to finish ends the next stage's input
+        with stage.lock:
+            stage.running -= 1
+            last = stage.running == 0
+        if last and next_stage is not None:
+            for _ in range(next_stage.workers):
+                next_stage.put(END_OF_INPUT)
+
+    def report_error(self, item, stage: PipelineStage, e: Exception):
+        """Pass a failed item to on_error, printing any error on_error raises so the worker keeps running."""
+        if not self.on_error:
+            return
+        try:
+            self.on_error(item, stage.name, e)
+        except Exception as callback_error:
+            print("ERROR: Unable to report failed item {} ({} stage): {}".format(item, stage.name, callback_error))
+
+    def stats(self) -> list:
+        """Get every stage's stats: processed, failed, items/s, utilization, blocked share and queue depth."""
+        elapsed = max(time.monotonic() - self.started, 1e-9) if self.started else 1e-9
+        stats = []
+        for stage in self.stages:
+            with stage.lock:
+                stats.append({
+                    "stage": stage.name,
+                    "workers": stage.workers,
+                    "processed": stage.processed,
+                    "failed": stage.failed,
+                    "per_sec": stage.processed / elapsed,
+                    "utilization": stage.busy / (stage.workers * elapsed),
+                    "blocked": stage.blocked / (stage.workers * elapsed),
+                    "queue": stage.queue.qsize(),
+                    "max_queue": stage.max_depth,
+                    "capacity": stage.queue.maxsize
+                })
+
+        return stats
+
+    def format_stats(self) -> str:
+        """Format every stage's stats as a table, naming the busiest stage as the bottleneck."""
+        stats = self.stats()
+        lines = ["{:<10} {:>7} {:>9} {:>7} {:>6} {:>8} {:>7}".format(
+            "stage", "workers", "processed", "items/s", "busy", "blocked", "queue")]
+        for stage in stats:
+            lines.append("{:<10} {:>7} {:>9} {:>7.2f} {:>5.0%} {:>7.0%} {:>3}/{:<3}".format(
+                stage["stage"], stage["workers"], stage["processed"], stage["per_sec"], stage["utilization"],
+                stage["blocked"], stage["queue"], stage["capacity"]))
+
+        bottleneck = max(stats, key=lambda stage: stage["utilization"])
+        lines.append("Bottleneck: {} ({:.0%} busy)".format(bottleneck["stage"], bottleneck["utilization"]))
+
+        return "\n".join(lines)
+
+    def report(self, interval: float, done: threading.Event):
+        """Print the stats table every interval until the run is done."""
+        while not done.wait(interval):
+            print(self.format_stats(), flush=True)
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+class StatsServer(ThreadingHTTPServer):
+    """A local stand-in for the stats API that replays recorded endpoint responses."""
+    daemon_threads = True
+
+    def __init__(self, fixtures_dir: str, host: str = "127.0.0.1", port: int = 0, latency: float = 0,
+                 jitter: float = 0, error_rate: float = 0, error_status: int = 503, seed: int = None):
+        """Initialize a StatsServer object.
+
+        Args:
+            fixtures_dir (str): Directory of recorded responses, one subdirectory per endpoint.
+            host (str, optional): Interface to listen on. Defaults to localhost.
+            port (int, optional): Port to listen on. Defaults to a free port.
+            latency (float, optional): Seconds added to every response.
+            jitter (float, optional): Maximum random seconds added on top of the latency.
+            error_rate (float, optional): Probability of answering a request with error_status.
+            error_status (int, optional): HTTP status returned for injected errors. Defaults to 503.
+            seed (int, optional): Seed for latency jitter and error injection, for deterministic runs.
+        """
+        super().__init__((host, port), StatsRequestHandler)
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to configure the stats API client with, containing an '{endpoint}' placeholder."""
+        host, port = self.server_address[:2]
+        return "http://{}:{}/stats/".format(host, port) + "{endpoint}"
+
+    def start(self) -> "StatsServer":
+        """Serve requests on a background daemon thread."""
+        self.thread = threading.Thread(target=self.serve_forever, name="stats-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests and close the socket."""
+        self.shutdown()
+        self.server_close()
+
+    @staticmethod
+    def make_fixture_key(query: str) -> str:
+        """Build a stable fixture key from a request query string, independent of parameter order.
+
+        Args:
+            query (str): URL-encoded query string of the request.
+
+        Returns:
+            str: Hex digest identifying the request parameters.
+        """
+        parameters = sorted(parse_qsl(query, keep_blank_values=True))
+        return hashlib.sha1(json.dumps(parameters).encode("utf-8")).hexdigest()
+
+    def get_fixture_path(self, endpoint: str, query: str) -> str:
+        """Get the path of the recorded response of an endpoint request."""
+        return os.path.join(self.fixtures_dir, endpoint, self.make_fixture_key(query) + ".json")
+
+    def draw(self) -> tuple:
+        """Draw the injected delay and whether to inject an error for one request."""
+        with self.random_lock:
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            failed = self.random.random() < self.error_rate
+        return delay, failed
+
+
+class StatsRequestHandler(BaseHTTPRequestHandler):
+    """Serves '/stats/<endpoint>?<parameters>' from the server's recorded fixtures."""
+    # Keep connections alive between requests, like the real stats API
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        endpoint = url.path.rstrip("/").rsplit("/", 1)[-1].lower()
+
+        delay, failed = self.server.draw()
+        if delay:
+            time.sleep(delay)
+
+        if failed:
+            return self.send_json(self.server.error_status, json.dumps({"message": "Injected error"}))
+
+        try:
+            with open(self.server.get_fixture_path(endpoint, url.query)) as f:
+                fixture = json.load(f)
+        except FileNotFoundError:
+            return self.send_json(404, json.dumps({"message": "No recorded response for {}".format(self.path)}))
+
+        self.send_json(fixture["status_code"], fixture["response"])
+
+    def send_json(self, status: int, body: str):
+        """Send a JSON response body."""
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+        pass
@@ -0,0 +1,108 @@
+import threading
+from classes.player_index import PlayerIndex
+
+# Former abbreviations, names and cities of current franchises (alias -> current abbreviation)
+HISTORICAL_TEAM_NAMES = {
+    # Relocated and renamed franchises
+    'NJN': 'BKN', 'New Jersey Nets': 'BKN', 'New Jersey': 'BKN',
+    'SEA': 'OKC', 'Seattle SuperSonics': 'OKC', 'SuperSonics': 'OKC', 'Sonics': 'OKC', 'Seattle': 'OKC',
+    'NOH': 'NOP', 'New Orleans Hornets': 'NOP',
+    'NOK': 'NOP', 'New Orleans/Oklahoma City Hornets': 'NOP',
+    'VAN': 'MEM', 'Vancouver Grizzlies': 'MEM', 'Vancouver': 'MEM',
+    'CHH': 'CHA', 'Charlotte Bobcats': 'CHA', 'Bobcats': 'CHA',
+    'WSB': 'WAS', 'Washington Bullets': 'WAS', 'Bullets': 'WAS',
+    'KCK': 'SAC', 'Kansas City Kings': 'SAC', 'Kansas City': 'SAC',
+    'SDC': 'LAC', 'San Diego Clippers': 'LAC', 'San Diego': 'LAC',
+    'NOJ': 'UTA', 'New Orleans Jazz': 'UTA',
+    'SFW': 'GSW', 'San Francisco Warriors': 'GSW',
+
+    # Alternate abbreviations used by other sources
+    'BRK': 'BKN', 'CHO': 'CHA', 'PHO': 'PHX', 'GS': 'GSW', 'NO': 'NOP', 'NY': 'NYK', 'SA': 'SAS', 'UTAH': 'UTA',
+
+    # Common names
+    'Sixers': 'PHI', 'Philly': 'PHI', 'Cavs': 'CLE', 'Mavs': 'DAL', 'Wolves': 'MIN', 'Blazers': 'POR'
+}
+
+
+class TeamIndex:
+    """A precomputed index resolving any team key to its team record in one hash lookup.
+
+    Abbreviations, full names, nicknames, cities and historical names (e.g. 'SEA' or 'New Jersey
+    Nets') are normalized like player names and mapped to the current franchise. Keys shared by
+    several teams (e.g. 'Los Angeles') are ambiguous and do not resolve to either team.
+    """
+    def __init__(self, teams: list = None, aliases: dict = None):
+        """Initialize a TeamIndex object.
+
+        Args:
+            teams (list, optional): Team records to index. Defaults to nba_api's static team list.
+            aliases (dict, optional): Alias -> current abbreviation. Defaults to HISTORICAL_TEAM_NAMES.
+        """
+        self.teams = teams
+        self.aliases = HISTORICAL_TEAM_NAMES if aliases is None else aliases
+        self.keys = None
+        self.ids = None
+        self.lock = threading.Lock()
+
+    def build(self):
+        """Build the index, if not built yet."""
+        with self.lock:
+            if self.keys is not None:
+                return
+
+            teams = self.teams
+            if teams is None:
+                from nba_api.stats.static import teams as static_teams
+                teams = static_teams.get_teams()
+
+            keys = {}
+            for team in sorted(teams, key=lambda team: team['id']):
+                for field in ('abbreviation', 'full_name', 'nickname', 'city'):
+                    matches = keys.setdefault(PlayerIndex.normalize(team[field]), [])
+                    if team not in matches:
+                        matches.append(team)
+
+            # Aliases never shadow a current team's own keys
+            by_abbreviation = {team['abbreviation']: team for team in teams}
+            for alias, abbreviation in self.aliases.items():
+                if abbreviation in by_abbreviation:
+                    keys.setdefault(PlayerIndex.normalize(alias), [by_abbreviation[abbreviation]])
+
+            self.ids = {team['id']: team for team in teams}
+            self.keys = keys
+
+    def get(self, key: str) -> dict:
+        """Get the team with an abbreviation, full name, nickname, city or historical name.
+
+        Args:
+            key (str): Any team key, in any case.
+
+        Returns:
+            dict: The team's record, or None if no team or several teams have the key.
+        """
+        matches = self.get_all(key)
+        return matches[0] if len(matches) == 1 else None
+
+    def get_all(self, key: str) -> list:
+        """Get every team with a key, by id."""
+        if self.keys is None:
+            self.build()
+        return self.keys.get(PlayerIndex.normalize(key), [])
+
+    def get_by_id(self, team_id: int) -> dict:
+        """Get the team with an id, or None."""
+        if self.ids is None:
+            self.build()
+        return self.ids.get(int(team_id))
+
+    def get_teams(self) -> list:
+        """Get every team, by id."""
+        if self.ids is None:
+            self.build()
+        return sorted(self.ids.values(), key=lambda team: team['id'])
+
+    def entries(self) -> list:
+        """Get every (key, team) pair of the index, e.g. to build a fuzzy search over the same keys."""
+        if self.keys is None:
+            self.build()
+        return [(key, team) for key, matches in self.keys.items() for team in matches]
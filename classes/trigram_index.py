@@ -0,0 +1,115 @@
+import heapq
+import threading
+from collections import Counter
+from itertools import chain
+
+
+class TrigramIndex:
+    """A trigram index for fuzzy, ranked name search.
+
+    Every indexed name is split into character trigrams (each word padded, so word starts weigh
+    more) held in posting lists. A query counts the trigrams it shares with every name in one pass
+    over its posting lists and ranks names by Dice similarity, so typos like 'Antetokoumpo' still
+    rank 'Antetokounmpo' first without scanning every name.
+
+    Several names may point to the same record (e.g. a team's full name, nickname and city); each
+    record is returned once, with its best score.
+    """
+    # Score a fuzzy match needs, and its lead over the runner-up, to be accepted without asking
+    RESOLVE_SCORE = 0.75
+    RESOLVE_MARGIN = 0.15
+
+    def __init__(self, load_entries, normalize=None):
+        """Initialize a TrigramIndex object.
+
+        Args:
+            load_entries (callable): Returns the (name, record) pairs to index. Records need an 'id'.
+                Called once, on the first search.
+            normalize (callable, optional): Normalizes names and queries before indexing. Defaults to lowercasing.
+        """
+        self.load_entries = load_entries
+        self.normalize = normalize or str.lower
+        self.postings = None
+        self.names = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_trigrams(name: str) -> set:
+        """Get the trigrams of a normalized name, padding each word with two leading and one trailing space."""
+        trigrams = set()
+        for word in name.split():
+            padded = "  " + word + " "
+            trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return trigrams
+
+    def build(self):
+        """Build the posting lists, if not built yet."""
+        with self.lock:
+            if self.postings is not None:
+                return
+
+            postings = {}
+            for name, record in self.load_entries():
+                trigrams = self.get_trigrams(self.normalize(name))
+                if not trigrams:
+                    continue
+                position = len(self.names)
+                self.names.append((len(trigrams), record))
+                for trigram in trigrams:
+                    postings.setdefault(trigram, []).append(position)
+
+            self.postings = postings
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.3) -> list:
+        """Get the records whose names best match a query.
+
+        Args:
+            query (str): Name to search for, possibly misspelled or partial.
+            limit (int, optional): Maximum number of records to return. Defaults to 5.
+            min_score (float, optional): Minimum Dice similarity (0 to 1) of a match. Defaults to 0.3.
+
+        Returns:
+            list: (score, record) pairs, best match first. Ties keep the order records were indexed in.
+        """
+        if self.postings is None:
+            self.build()
+
+        trigrams = self.get_trigrams(self.normalize(query))
+        if not trigrams:
+            return []
+
+        # Count shared trigrams per name in C, then skip names that cannot reach min_score
+        shared = Counter(chain.from_iterable(self.postings.get(trigram, ()) for trigram in trigrams))
+        required = min_score * len(trigrams) / 2
+
+        best = {}
+        for position, count in shared.items():
+            if count < required:
+                continue
+            size, record = self.names[position]
+            score = 2 * count / (size + len(trigrams))
+            if score >= min_score and score > best.get(record["id"], (0,))[0]:
+                best[record["id"]] = (score, -position, record)
+
+        return [(score, record) for score, _, record in heapq.nlargest(limit, best.values(), key=lambda match: match[:2])]
+
+    def resolve(self, query: str, limit: int = 5) -> tuple:
+        """Resolve a query to a single record, only when its best match is both close and clearly ahead.
+
+        Args:
+            query (str): Name to search for, possibly misspelled or partial.
+            limit (int, optional): Maximum number of suggestions. Defaults to 5.
+
+        Returns:
+            tuple: The resolved record (None if the query is too far off or ambiguous) and the
+                ranked (score, record) suggestions.
+        """
+        matches = self.search(query, limit=limit)
+        if not matches or matches[0][0] < self.RESOLVE_SCORE:
+            return None, matches
+
+        # A runner-up about as close as the best match (e.g. a name two players share) is ambiguous
+        if len(matches) > 1 and matches[0][0] - matches[1][0] < self.RESOLVE_MARGIN:
+            return None, matches
+
+        return matches[0][1], matches
@@ -0,0 +1,431 @@
+import json
+import os
+import pandas as pd
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from classes.ingest_journal import IngestJournal
+from classes.league_shot_index import LeagueShotIndex
+from classes.shotchart import ShotChart
+from classes.staged_pipeline import StagedPipeline
+from helpers.prefetch_utils import cache_league_shotcharts
+from helpers.schema_utils import decode_shotchart_payload
+from helpers.shotchart_utils import DATA_DIR
+from helpers.shotchart_utils import SHOT_ARCHIVE
+from helpers.shotchart_utils import SHOT_WAREHOUSE
+from helpers.shotchart_utils import TEAM_INDEX
+from helpers.shotchart_utils import fetch_league_shotchart_data
+from helpers.shotchart_utils import get_final_shots
+from helpers.shotchart_utils import invalidate_cached_games
+from helpers.shotchart_utils import request_shotchart_body
+from helpers.shotchart_utils import request_shotchart_data
+
+# Ingest Journal (completed and failed backfill units, for resuming runs and retrying failures)
+INGEST_JOURNAL = IngestJournal(os.path.join(DATA_DIR, "ingest_journal.jsonl"))
+
+
+class BackfillProgress:
+    """Thread-safe progress, throughput and ETA reporting for a backfill run."""
+    def __init__(self, total: int):
+        """Initialize a BackfillProgress object.
+
+        Args:
+            total (int): Number of requests the run will make.
+        """
+        self.total = total
+        self.completed = 0
+        self.rows = 0
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+
+    def update(self, label: str, rows: int):
+        """Record a completed request and print the progress line.
+
+        Args:
+            label (str): Description of the completed request.
+            rows (int): Number of shots fetched by the request.
+        """
+        with self.lock:
+            self.completed += 1
+            self.rows += rows
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            requests_per_sec = self.completed / elapsed
+            rows_per_sec = self.rows / elapsed
+            eta = timedelta(seconds=round((self.total - self.completed) / requests_per_sec))
+
+            print("[{}/{}] {}: {:,} shots | {:.2f} req/s, {:,.0f} rows/s | ETA {}".format(
+                self.completed, self.total, label, rows, requests_per_sec, rows_per_sec, eta))
+
+
+def make_ingest_units(season: str, season_types: list, incremental: bool=False) -> list:
+    """Build the units of work of a season backfill, one per (team, season type).
+
+    Args:
+        season (str): The season to backfill.
+        season_types (list): The types of season to backfill.
+        incremental (bool, optional): Whether to only sync games after each team's high-water mark.
+
+    Returns:
+        list: Units as dicts of team_id, season, season_type, date_from and date_to.
+    """
+    return [{'team_id': team['id'], 'season': season, 'season_type': season_type,
+             'date_from': get_sync_date_from(season, season_type, team) if incremental else None, 'date_to': None}
+            for season_type in season_types for team in TEAM_INDEX.get_teams()]
+
+
+def get_sync_date_from(season: str, season_type: str, team: dict) -> str:
+    """Get the first date a sync must fetch: the day after a team's high-water mark.
+
+    Args:
+        season (str): The season to sync.
+        season_type (str): The type of season to sync.
+        team (dict): A dictionary containing information about the team.
+
+    Returns:
+        str: The date in the format 'mm/dd/yyyy', or None if the team was never ingested.
+    """
+    watermark = SHOT_WAREHOUSE.get_watermark(season, season_type, team['id'])
+    if not watermark:
+        return None
+
+    latest = datetime.strptime(watermark['GAME_DATE'], '%Y%m%d')
+    return (latest + timedelta(days=1)).strftime('%m/%d/%Y')
+
+
+def make_ingest_pipeline(max_workers: int=8, queue_size: int=4, on_complete=None, on_error=None) -> StagedPipeline:
+    """Build the staged ingest pipeline: fetch, decode, normalize, classify and write.
+
+    Fetching is network-bound and gets every worker; the CPU-bound stages get two threads each and
+    the warehouse a single writer. Queues between stages hold at most queue_size payloads, so a slow
+    stage holds back the fetchers instead of letting raw responses pile up in memory.
+
+    Args:
+        max_workers (int, optional): Number of concurrent fetches. Defaults to 8.
+        queue_size (int, optional): Capacity of each queue between stages. Defaults to 4.
+        on_complete (callable, optional): Called as on_complete(unit, rows) once a unit is written.
+        on_error (callable, optional): Called as on_error(unit, stage_name, exception) when a unit fails.
+
+    Returns:
+        StagedPipeline: The pipeline, ready to run over ingest units.
+    """
+    stages = [
+        ('fetch', fetch_unit, max_workers),
+        ('decode', decode_unit, 2),
+        ('normalize', normalize_unit, 2),
+        ('classify', classify_unit, 2),
+        ('write', write_unit, 1)
+    ]
+    return StagedPipeline(stages, queue_size=queue_size, on_complete=on_complete, on_error=on_error)
+
+
+def fetch_unit(unit: dict, payload=None) -> str:
+    """Pipeline stage: request a unit's raw ShotChartDetail response body."""
+    return request_shotchart_body(0, unit['team_id'], unit['season'], unit['season_type'], unit['date_from'],
+                                  unit['date_to'])
+
+
+def decode_unit(unit: dict, body: str) -> dict:
+    """Pipeline stage: parse a unit's raw response body."""
+    return json.loads(body)
+
+
+def normalize_unit(unit: dict, payload: dict) -> pd.DataFrame:
+    """Pipeline stage: decode a unit's parsed payload into the typed ingest schema."""
+    return decode_shotchart_payload(payload)
+
+
+def classify_unit(unit: dict, shotchart_df: pd.DataFrame) -> pd.DataFrame:
+    """Pipeline stage: precompute the ShotCharts of a sync unit's games, one game date at a time.
+
+    The team's and its players' charts are cached under the same keys the prefetch daemon and
+    interactive requests use. Whole-season units pass through unclassified; their charts are
+    processed on demand from the warehouse instead of holding back the fetchers.
+    """
+    if unit['date_from'] and not shotchart_df.empty:
+        team = TEAM_INDEX.get_by_id(unit['team_id'])
+        for game_date, game_df in get_final_shots(shotchart_df).groupby('GAME_DATE'):
+            cache_league_shotcharts(LeagueShotIndex(game_df[ShotChart.COLUMNS]), unit['season'], unit['season_type'],
+                                    game_date.strftime('%m/%d/%Y'), [team])
+
+    return shotchart_df
+
+
+def write_unit(unit: dict, shotchart_df: pd.DataFrame) -> int:
+    """Pipeline stage: store a unit's shots in the shot warehouse."""
+    store_team_shots(shotchart_df, unit['season'], unit['season_type'], TEAM_INDEX.get_by_id(unit['team_id']))
+    return len(shotchart_df)
+
+
+def store_team_shots(shotchart_df: pd.DataFrame, season: str, season_type: str, team: dict):
+    """Write a team's shots to the shot warehouse and advance its high-water mark.
+
+    Games played today may still be in progress, so they are left for the next sync.
+
+    Args:
+        shotchart_df (pd.DataFrame): DataFrame of the team's shots.
+        season (str): The season of the shots.
+        season_type (str): The type of season of the shots.
+        team (dict): A dictionary containing information about the team.
+    """
+    shotchart_df = get_final_shots(shotchart_df)
+    if shotchart_df.empty:
+        return
+
+    SHOT_WAREHOUSE.write(shotchart_df, season, season_type)
+
+    # The watermark only moves once the shots are safely stored
+    latest = shotchart_df.sort_values(['GAME_DATE', 'GAME_ID']).iloc[-1]
+    SHOT_WAREHOUSE.set_watermark(season, season_type, team['id'], latest['GAME_DATE'].strftime('%Y%m%d'),
+                                  str(latest['GAME_ID']))
+
+
+def continues_watermark(season: str, season_type: str, team_id: int, date_from: str) -> bool:
+    """Check whether shots fetched from a date on continue a team's high-water mark without a gap.
+
+    Args:
+        season (str): The season of the shots.
+        season_type (str): The type of season of the shots.
+        team_id (int): The unique identifier of the team.
+        date_from (str): Earliest fetched game date in the format 'mm/dd/yyyy'.
+
+    Returns:
+        bool: True if the team has a watermark on or after date_from.
+    """
+    watermark = SHOT_WAREHOUSE.get_watermark(season, season_type, team_id)
+    return bool(watermark) and datetime.strptime(date_from, '%m/%d/%Y').strftime('%Y%m%d') <= watermark['GAME_DATE']
+
+
+def revalidate_team(season: str, season_type: str, team: dict, days: int) -> int:
+    """Re-fetch a team's recent games and replace those the league has corrected since they were stored.
+
+    Fresh games are fingerprinted and compared with the stored fingerprints; only games whose shots
+    changed are rewritten, and cached shots and ShotCharts that include them are invalidated. Games
+    not stored yet are appended; the team's high-water mark only advances when the re-fetched window
+    reaches back to it, since games stored before the window may have gaps.
+
+    Args:
+        season (str): The season to revalidate.
+        season_type (str): The type of season to revalidate.
+        team (dict): A dictionary containing information about the team.
+        days (int): Number of days of recent games to re-fetch.
+
+    Returns:
+        int: Number of corrected games.
+    """
+    date_from = (datetime.now() - timedelta(days=days)).strftime('%m/%d/%Y')
+    shotchart_df = request_shotchart_data(0, team['id'], season, season_type, date_from)
+    if shotchart_df.empty:
+        return 0
+
+    corrected = replace_corrected_games(shotchart_df, season, season_type)
+    if continues_watermark(season, season_type, team['id'], date_from):
+        store_team_shots(shotchart_df, season, season_type, team)
+    else:
+        SHOT_WAREHOUSE.write(get_final_shots(shotchart_df), season, season_type)
+
+    return corrected
+
+
+def replace_corrected_games(shotchart_df: pd.DataFrame, season: str, season_type: str) -> int:
+    """Replace stored games whose shots differ from a newer copy, and invalidate caches that include them.
+
+    Each team's fresh games are fingerprinted and compared with the team's stored fingerprints;
+    games not stored yet are left for the caller to append.
+
+    Args:
+        shotchart_df (pd.DataFrame): A newer copy of every shot of one or more games.
+        season (str): The season of the games.
+        season_type (str): The type of season of the games.
+
+    Returns:
+        int: Number of corrected games.
+    """
+    corrected = 0
+    for team_id, team_df in shotchart_df.groupby('TEAM_ID', observed=True):
+        stored = SHOT_WAREHOUSE.get_game_hashes(season, season_type, int(team_id))
+        fresh = SHOT_WAREHOUSE.hash_games(team_df)
+        changed = [game_id for game_id, digest in fresh.items() if game_id in stored and stored[game_id] != digest]
+        if not changed:
+            continue
+
+        changed_df = team_df[team_df['GAME_ID'].astype(str).isin(changed)]
+        SHOT_WAREHOUSE.replace_games(changed_df, season, season_type)
+        invalidate_cached_games(season, season_type, int(team_id),
+                                changed_df['GAME_DATE'].dt.strftime('%Y%m%d').unique().tolist())
+        corrected += len(changed)
+
+    return corrected
+
+
+def revalidate_season(season: str, season_types: list, days: int=7, max_workers: int=8) -> int:
+    """Revalidate the recent games of every stored team concurrently.
+
+    Args:
+        season (str): The season to revalidate.
+        season_types (list): The types of season to revalidate.
+        days (int, optional): Number of days of recent games to re-fetch. Defaults to 7.
+        max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        int: Total number of corrected games.
+    """
+    teams_by_id = {team['id']: team for team in TEAM_INDEX.get_teams()}
+    units = [(season_type, teams_by_id[team_id]) for season_type in season_types
+             for team_id in SHOT_WAREHOUSE.get_team_ids(season, season_type) if team_id in teams_by_id]
+    progress = BackfillProgress(len(units))
+    corrected = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(revalidate_team, season, season_type, team, days): (season_type, team)
+                   for season_type, team in units}
+
+        for future in as_completed(futures):
+            season_type, team = futures[future]
+            label = "{} {} {}".format(team['abbreviation'], season, season_type)
+            try:
+                games = future.result()
+                corrected += games
+                progress.update(label + " ({} corrected games)".format(games), 0)
+            except Exception as e:
+                print("ERROR: Unable to revalidate {}: {}".format(label, e))
+                progress.update(label, 0)
+
+    return corrected
+
+
+def backfill_season(season: str, season_types: list, max_workers: int=8, incremental: bool=False,
+                    resume: bool=False, retry_dead_letters: bool=False, queue_size: int=4,
+                    report_interval: float=None) -> int:
+    """Backfill a whole season for all 30 teams through the staged ingest pipeline.
+
+    Units flow through concurrent fetch, decode, normalize, classify and write stages connected by
+    bounded queues; the global stats API rate limiter keeps the combined request rate under the
+    allowed limit. Every finished unit is appended to the ingest journal, so a crashed run can
+    resume without redoing finished units, and failed units land on the dead-letter list instead
+    of stopping the run.
+
+    Args:
+        season (str): The season to backfill.
+        season_types (list): The types of season to backfill.
+        max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+        incremental (bool, optional): Whether to only sync games after each team's high-water mark.
+        resume (bool, optional): Whether to skip units the journal records as done. Defaults to False.
+        retry_dead_letters (bool, optional): Whether to only retry the season's failed units. Defaults to False.
+        queue_size (int, optional): Capacity of each queue between pipeline stages. Defaults to 4.
+        report_interval (float, optional): Seconds between printed stage reports. Defaults to none.
+
+    Returns:
+        int: Total number of shots fetched.
+    """
+    if retry_dead_letters:
+        units = [entry['unit'] for entry in INGEST_JOURNAL.dead_letters()
+                 if entry['unit']['season'] == season and entry['unit']['season_type'] in season_types]
+    else:
+        units = make_ingest_units(season, season_types, incremental)
+        if resume:
+            completed = INGEST_JOURNAL.completed()
+            units = [unit for unit in units if INGEST_JOURNAL.make_key(unit) not in completed]
+
+    progress = BackfillProgress(len(units))
+    failed = []
+
+    def get_label(unit: dict) -> str:
+        return "{} {} {}".format(TEAM_INDEX.get_by_id(unit['team_id'])['abbreviation'], season,
+                                 unit['season_type'])
+
+    def on_complete(unit: dict, rows: int):
+        INGEST_JOURNAL.record(unit, 'done', rows=rows)
+        progress.update(get_label(unit), rows)
+
+    def on_error(unit: dict, stage: str, e: Exception):
+        print("ERROR: Unable to backfill {} ({} stage): {}".format(get_label(unit), stage, e))
+        INGEST_JOURNAL.record(unit, 'failed', error="{}: {}".format(stage, e))
+        progress.update(get_label(unit), 0)
+        failed.append(unit)
+
+    pipeline = make_ingest_pipeline(max_workers, queue_size, on_complete=on_complete, on_error=on_error)
+    pipeline.run(units, report_interval=report_interval)
+    print(pipeline.format_stats())
+
+    if failed:
+        print("{} units failed; rerun with --retry_dead_letters to retry only them.".format(len(failed)))
+
+    return progress.rows
+
+
+def rebuild_from_archive(season: str, season_types: list) -> int:
+    """Rebuild a season's shot warehouse from archived raw ShotChartDetail responses, offline.
+
+    Team-wide and league-wide responses are replayed in the order they were fetched. A game stored
+    from an earlier response is replaced when a later one (e.g. a revalidation) differs, so stat
+    corrections survive a rebuild; games that were not final when a response was fetched (see
+    get_final_shots) may have been in progress and are skipped. A rebuild can safely run over a partially populated
+    store. A team's high-water mark only advances for whole-season pulls and for syncs continuing one.
+
+    Args:
+        season (str): The season to rebuild.
+        season_types (list): The types of season to rebuild.
+
+    Returns:
+        int: Total number of shots decoded from the archive.
+    """
+    entries = [entry for entry in SHOT_ARCHIVE.entries(endpoint='shotchartdetail')
+               if not int(entry['params']['PlayerID']) and entry['params']['Season'] == season
+               and entry['params']['SeasonType'] in season_types]
+    progress = BackfillProgress(len(entries))
+    teams_by_id = {team['id']: team for team in TEAM_INDEX.get_teams()}
+
+    for entry in entries:
+        params = entry['params']
+        team_id, season_type = int(params['TeamID']), params['SeasonType']
+        label = "{} {} {} ({})".format(teams_by_id.get(team_id, {}).get('abbreviation', 'NBA'), season, season_type,
+                                       entry['digest'][:12])
+        try:
+            shotchart_df = decode_shotchart_payload(json.loads(SHOT_ARCHIVE.get(entry['digest'])))
+        except (OSError, ValueError) as e:
+            print("ERROR: Unable to rebuild {}: {}".format(label, e))
+            progress.update(label, 0)
+            continue
+
+        # Later responses carry the league's corrections to games stored from earlier ones
+        shotchart_df = get_final_shots(shotchart_df, datetime.fromtimestamp(entry['archived']))
+        replace_corrected_games(shotchart_df, season, season_type)
+
+        continues_sync = params['DateFrom'] and continues_watermark(season, season_type, team_id, params['DateFrom'])
+        if team_id in teams_by_id and not params['DateTo'] and (not params['DateFrom'] or continues_sync):
+            store_team_shots(shotchart_df, season, season_type, teams_by_id[team_id])
+        elif not shotchart_df.empty:
+            SHOT_WAREHOUSE.write(shotchart_df, season, season_type)
+
+        progress.update(label, len(shotchart_df))
+
+    return progress.rows
+
+
+def ingest_league_date(season: str, season_types: list, game_date: str) -> dict:
+    """Pull every shot in the league on a game date, one league-wide request per season type.
+
+    The shots are stored in the shot warehouse and indexed in memory by team and player; every
+    team's and player's ShotChart for the date is then built from the index and cached, instead of
+    with one request per team.
+
+    Args:
+        season (str): The season in which the games were played.
+        season_types (list): The types of season to pull.
+        game_date (str): The date on which the games were played in the format 'mm/dd/yyyy'.
+
+    Returns:
+        dict: LeagueShotIndex objects keyed by season type.
+    """
+    league_indexes = {}
+    for season_type in season_types:
+        league_index = fetch_league_shotchart_data(season, season_type, game_date, use_cache=False)
+        cache_league_shotcharts(league_index, season, season_type, game_date,
+                                [team for team in map(TEAM_INDEX.get_by_id, league_index.team_ids) if team])
+        print("{} {} {}: {:,} shots by {} teams and {} players".format(
+            game_date, season, season_type, len(league_index.df), len(league_index.team_ids),
+            len(league_index.player_ids)))
+        league_indexes[season_type] = league_index
+
+    return league_indexes
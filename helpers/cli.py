@@ -1,5 +1,6 @@
 import argparse
 from helpers.shotchart_utils import CURRENT_SEASON
+from helpers.shotchart_utils import SEASON_TYPES
 from helpers.shotchart_utils import get_game_date
 
 
@@ -11,7 +12,7 @@ def parse_args():
                          help="Season which game was played")
 
     parser.add_argument('--season_type', dest='season_type', nargs='+', type=str, metavar='', required=False,
-                         choices=('Pre Season','Regular Season', 'All Star','Playoffs'),
+                         choices=SEASON_TYPES,
                          default='Regular Season',
                          help="Teams' Season for Salary Cap Infomation")
 
@@ -19,8 +20,19 @@ def parse_args():
                          default=get_game_date(),
                          help="Date Game Played")
 
-    parser.add_argument('--player', dest='player', type=str, metavar='', required=False,
-                         help="Player's Full Name")
+    parser.add_argument('--date_from', dest='date_from', type=str, metavar='', required=False,
+                         default=None,
+                         help="Earliest Date of a Range of Games (overrides --game_date)")
+
+    parser.add_argument('--date_to', dest='date_to', type=str, metavar='', required=False,
+                         default=None,
+                         help="Latest Date of a Range of Games (overrides --game_date)")
+
+    parser.add_argument('--player', dest='player', nargs='+', type=str, metavar='', required=False,
+                         help="Full Names of One or More Players (each charted separately; players not on the team are charted across every team)")
+
+    parser.add_argument('--roster', dest='roster', action='store_true', required=False,
+                         help="Chart every player on the team from a single team-wide request")
 
     parser.add_argument('--team_abr', dest='team_abr', type=str, metavar='', required=False,
                          default=None,
@@ -60,4 +72,170 @@ def parse_args():
     parser.add_argument('--periods', dest='periods', action='store_true', required=False,
                          help='') 
 
+    parser.add_argument('--no_cache', dest='use_cache', action='store_false', required=False,
+                         help='Bypass the on-disk shot cache')
+
+    add_request_arguments(parser)
+    add_replay_arguments(parser)
+
+    return parser.parse_args()
+
+
+def parse_backfill_args():
+    parser = argparse.ArgumentParser(description='Shotchart Backfill Command Line Interface')
+
+    parser.add_argument('--season', dest='season', nargs='+', type=str, metavar='', required=False,
+                         default=[CURRENT_SEASON],
+                         help="Seasons to backfill")
+
+    parser.add_argument('--season_type', dest='season_type', nargs='+', type=str, metavar='', required=False,
+                         choices=SEASON_TYPES,
+                         default=list(SEASON_TYPES),
+                         help="Season types to backfill (defaults to all)")
+
+    parser.add_argument('--workers', dest='workers', type=int, metavar='', required=False,
+                         default=8,
+                         help="Maximum number of concurrent requests")
+
+    parser.add_argument('--rate', dest='rate', type=float, metavar='', required=False,
+                         default=2,
+                         help="Maximum sustained requests per second")
+
+    parser.add_argument('--burst', dest='burst', type=int, metavar='', required=False,
+                         default=5,
+                         help="Maximum burst of requests above the sustained rate")
+
+    parser.add_argument('--sync', dest='sync', action='store_true', required=False,
+                         help="Only fetch games after each team's latest ingested game")
+
+    parser.add_argument('--queue_size', dest='queue_size', type=int, metavar='', required=False,
+                         default=4,
+                         help="Maximum units waiting between ingest pipeline stages")
+
+    parser.add_argument('--stage_report', dest='stage_report', type=float, metavar='', required=False,
+                         default=None,
+                         help="Print each ingest stage's throughput and queue depth every N seconds")
+
+    parser.add_argument('--resume', dest='resume', action='store_true', required=False,
+                         help="Skip units the ingest journal records as done (resume a crashed backfill)")
+
+    parser.add_argument('--retry_dead_letters', dest='retry_dead_letters', action='store_true', required=False,
+                         help="Only retry units that failed in earlier backfills")
+
+    parser.add_argument('--league_date', dest='league_date', type=str, metavar='', required=False,
+                         default=None,
+                         help="Pull every team's shots on this date ('mm/dd/yyyy') with one league-wide request")
+
+    parser.add_argument('--revalidate', dest='revalidate', type=int, metavar='', required=False,
+                         default=None,
+                         help="Re-fetch the last N days of stored games and replace any the league corrected")
+
+    parser.add_argument('--from_archive', dest='from_archive', action='store_true', required=False,
+                         help="Rebuild the warehouse from archived raw responses without any requests")
+
+    add_request_arguments(parser)
+    add_replay_arguments(parser)
+
+    return parser.parse_args()
+
+
+def parse_prefetch_args():
+    parser = argparse.ArgumentParser(description='Shotchart Prefetch Daemon Command Line Interface')
+
+    parser.add_argument('--season', dest='season', type=str, metavar='', required=False,
+                         default=CURRENT_SEASON,
+                         help="Season to prefetch")
+
+    parser.add_argument('--season_type', dest='season_type', type=str, metavar='', required=False,
+                         choices=SEASON_TYPES,
+                         default='Regular Season',
+                         help="Season type to prefetch")
+
+    parser.add_argument('--schedule', dest='schedule', type=str, metavar='', required=False,
+                         default=None,
+                         help="CSV schedule (GAME_DATE, START_TIME, HOME_TEAM, AWAY_TEAM). Defaults to the teams in the local store")
+
+    parser.add_argument('--interval', dest='interval', type=float, metavar='', required=False,
+                         default=300,
+                         help="Seconds between checks for finished games")
+
+    parser.add_argument('--workers', dest='workers', type=int, metavar='', required=False,
+                         default=4,
+                         help="Maximum number of concurrent prefetches")
+
+    parser.add_argument('--once', dest='once', action='store_true', required=False,
+                         help="Prefetch every finished game once and exit")
+
+    add_request_arguments(parser)
+    add_replay_arguments(parser)
+
     return parser.parse_args()
+
+
+def parse_stats_server_args():
+    parser = argparse.ArgumentParser(description='Local Stand-In Stats Server Command Line Interface')
+
+    parser.add_argument('--fixtures', dest='fixtures', type=str, metavar='', required=True,
+                         help="Directory of recorded stats API responses")
+
+    parser.add_argument('--port', dest='port', type=int, metavar='', required=False,
+                         default=8000,
+                         help="Port to listen on")
+
+    add_injection_arguments(parser)
+
+    return parser.parse_args()
+
+
+def add_request_arguments(parser: argparse.ArgumentParser):
+    """Add stats API timeout, retry and latency reporting arguments to a parser."""
+    parser.add_argument('--timeout', dest='timeout', type=float, metavar='', required=False,
+                         default=30,
+                         help="Seconds before a stats API request attempt is abandoned")
+
+    parser.add_argument('--retries', dest='retries', type=int, metavar='', required=False,
+                         default=4,
+                         help="Retries of a failed stats API request, with exponential backoff")
+
+    parser.add_argument('--pool_size', dest='pool_size', type=int, metavar='', required=False,
+                         default=16,
+                         help="Keep-alive connections shared by every stats API request")
+
+    parser.add_argument('--latency_report', dest='latency_report', action='store_true', required=False,
+                         help="Print per-endpoint request latency histograms on exit")
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser):
+    """Add record/replay arguments for offline runs to a parser."""
+    parser.add_argument('--record', dest='record', type=str, metavar='', required=False,
+                         default=None,
+                         help="Record raw stats API responses to this fixtures directory")
+
+    parser.add_argument('--replay', dest='replay', type=str, metavar='', required=False,
+                         default=None,
+                         help="Replay stats API responses from this fixtures directory through a local server")
+
+    parser.add_argument('--stats_url', dest='stats_url', type=str, metavar='', required=False,
+                         default=None,
+                         help="Base URL of a stand-in stats server, e.g. 'http://127.0.0.1:8000/stats/{endpoint}'")
+
+    add_injection_arguments(parser)
+
+
+def add_injection_arguments(parser: argparse.ArgumentParser):
+    """Add latency and error injection arguments for the stand-in stats server to a parser."""
+    parser.add_argument('--replay_latency', dest='replay_latency', type=float, metavar='', required=False,
+                         default=0,
+                         help="Seconds of latency added to every replayed response")
+
+    parser.add_argument('--replay_jitter', dest='replay_jitter', type=float, metavar='', required=False,
+                         default=0,
+                         help="Maximum random seconds added on top of the replay latency")
+
+    parser.add_argument('--replay_error_rate', dest='replay_error_rate', type=float, metavar='', required=False,
+                         default=0,
+                         help="Probability of answering a replayed request with an error")
+
+    parser.add_argument('--replay_seed', dest='replay_seed', type=int, metavar='', required=False,
+                         default=None,
+                         help="Seed for replay latency jitter and error injection")
@@ -1,5 +1,4 @@
 import argparse
-from datetime import datetime
 import matplotlib
 import matplotlib.pyplot as plt
 import pandas as pd
@@ -57,10 +56,21 @@ def generate_title(shotchart: ShotChart, args: argparse.Namespace) -> str:
     Returns:
         str: The generated title.
     """
-    title = args.player + ' - ' + (args.team_abr or args.team_nickname)
+    # Name the player from the shots when the chart holds a single player (e.g. roster mode)
+    player_names = shotchart.df['PLAYER_NAME'].unique() if 'PLAYER_NAME' in shotchart.df.columns else []
+    player_name = player_names[0] if len(player_names) == 1 else ', '.join(args.player or [])
+
+    # Name the team from the shots when none was given (e.g. players compared across teams)
+    team_names = shotchart.df['TEAM_NAME'].unique() if 'TEAM_NAME' in shotchart.df.columns else []
+    team_name = args.team_abr or args.team_nickname or args.team_fullname or ', '.join(team_names)
+
+    title = ' - '.join(name for name in (player_name, team_name) if name)
     if 'GAME_DATE' in shotchart.df.columns:
-        game_date = datetime.strptime(str(shotchart.df.iloc[0]['GAME_DATE']), '%Y%m%d')
-        title += ' - ' + game_date.strftime('%m/%d/%Y')
+        first_date = shotchart.df['GAME_DATE'].min()
+        last_date = shotchart.df['GAME_DATE'].max()
+        title += ' - ' + first_date.strftime('%m/%d/%Y')
+        if last_date != first_date:
+            title += ' to ' + last_date.strftime('%m/%d/%Y')
     return title
 
 
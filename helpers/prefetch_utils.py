@@ -0,0 +1,208 @@
+import csv
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from classes.league_shot_index import LeagueShotIndex
+from classes.shotchart import ShotChart
+from helpers.shotchart_utils import ALL_TEAMS
+from helpers.shotchart_utils import SHOTCHART_CACHE
+from helpers.shotchart_utils import SHOT_CACHE_TTL
+from helpers.shotchart_utils import SHOT_WAREHOUSE
+from helpers.shotchart_utils import TEAM_INDEX
+from helpers.shotchart_utils import fetch_league_shotchart_data
+from helpers.shotchart_utils import get_cache_ttl
+from helpers.shotchart_utils import get_game_date
+from helpers.shotchart_utils import make_cache_params
+
+# Aggregates precomputed for every prefetched team and player chart
+PREFETCH_AGGREGATES = dict(points=True, shot_distances=True, shot_periods=True, shot_breakdown=True)
+
+# Hours after tip-off by which a game is assumed to have ended
+GAME_END_DELAY = 3
+
+# Days after a game ends during which it is still prefetched
+PREFETCH_WINDOW = 2
+
+
+def read_schedule(schedule_path: str) -> list:
+    """Read a schedule file of games.
+
+    The file is a CSV with the columns GAME_DATE ('mm/dd/yyyy'), START_TIME ('HH:MM', local time,
+    optional), HOME_TEAM and AWAY_TEAM (team abbreviations, current or historical).
+
+    Args:
+        schedule_path (str): Path of the schedule file.
+
+    Returns:
+        list: Games as dicts with 'game_date', 'ends' (datetime) and 'teams' (team dicts).
+    """
+    games = []
+    with open(schedule_path, newline='') as f:
+        for row in csv.DictReader(f):
+            start_time = (row.get('START_TIME') or '').strip()
+            if start_time:
+                ends = datetime.strptime(row['GAME_DATE'] + ' ' + start_time, '%m/%d/%Y %H:%M') + \
+                    timedelta(hours=GAME_END_DELAY)
+            else:
+                # Without a tip-off time, wait until the day is over
+                ends = datetime.strptime(row['GAME_DATE'], '%m/%d/%Y') + timedelta(days=1)
+
+            game_teams = [TEAM_INDEX.get(row[column].strip()) for column in ('HOME_TEAM', 'AWAY_TEAM')]
+            games.append({'game_date': row['GAME_DATE'], 'ends': ends,
+                          'teams': [team for team in game_teams if team]})
+
+    return games
+
+
+def get_due_units(season: str, season_type: str, schedule_path: str=None) -> list:
+    """Get the (game_date, team) pairs whose games have ended and should be prefetched.
+
+    With a schedule, every team whose game ended since yesterday is due. Without one, every team
+    with shots in the local store is due for yesterday's games.
+
+    Args:
+        season (str): The season of the games.
+        season_type (str): The type of season of the games.
+        schedule_path (str, optional): Path of a schedule file. Defaults to the teams in the local store.
+
+    Returns:
+        list: (game_date, team) pairs.
+    """
+    if schedule_path:
+        now = datetime.now()
+        return [(game['game_date'], team) for game in read_schedule(schedule_path)
+                if game['ends'] <= now and game['ends'] >= now - timedelta(days=PREFETCH_WINDOW)
+                for team in game['teams']]
+
+    team_ids = set(SHOT_WAREHOUSE.get_team_ids(season, season_type))
+    return [(get_game_date(), team) for team in TEAM_INDEX.get_teams() if team['id'] in team_ids]
+
+
+def prefetch_date(season: str, season_type: str, game_date: str, due_teams: list) -> dict:
+    """Pull a game date's shots league-wide and precompute the ShotCharts of teams whose games ended.
+
+    One league-wide request replaces a request per team; every chart is then built from the
+    in-memory league index. The pull always reaches the API, since other games may have ended
+    since the last poll.
+
+    Args:
+        season (str): The season in which the games were played.
+        season_type (str): The type of season in which the games were played.
+        game_date (str): The date on which the games were played in the format 'mm/dd/yyyy'.
+        due_teams (list): Dictionaries of the teams whose games ended.
+
+    Returns:
+        dict: Number of shots prefetched for each team, keyed by team ID.
+    """
+    league_index = fetch_league_shotchart_data(season, season_type, game_date, use_cache=False,
+                                               columns=ShotChart.COLUMNS)
+    return cache_league_shotcharts(league_index, season, season_type, game_date, due_teams)
+
+
+def cache_league_shotcharts(league_index: LeagueShotIndex, season: str, season_type: str, game_date: str,
+                            due_teams: list) -> dict:
+    """Precompute teams' and their players' ShotCharts from a league index and cache them.
+
+    Player charts are cached under both their team and every team (ALL_TEAMS), the two keys an
+    interactive player lookup can use.
+
+    Args:
+        league_index (LeagueShotIndex): Index of a game date's league-wide shots.
+        season (str): The season in which the games were played.
+        season_type (str): The type of season in which the games were played.
+        game_date (str): The date on which the games were played in the format 'mm/dd/yyyy'.
+        due_teams (list): Dictionaries of the teams to cache.
+
+    Returns:
+        dict: Number of shots cached for each team, keyed by team ID.
+    """
+    ttl = get_cache_ttl(game_date)
+    shots = {}
+    for team in due_teams:
+        team_shots = league_index.team_shots(team['id'])
+        shots[team['id']] = len(team_shots)
+        if team_shots.empty:
+            continue
+
+        # The team chart and every player's chart, keyed as interactive requests look them up
+        shotcharts = {0: league_index.team_shotchart(team['id'])}
+        shotcharts.update({int(player_id): league_index.player_shotchart(player_id)
+                           for player_id in team_shots['PLAYER_ID'].unique()})
+
+        for player_id, shotchart in shotcharts.items():
+            shotchart.process(**PREFETCH_AGGREGATES)
+            player = {'id': player_id} if player_id else 0
+            SHOTCHART_CACHE.set(make_cache_params(season, season_type, game_date, team, player), shotchart, ttl=ttl)
+
+            # Player lookups without a team (or off the team's roster) are keyed across every team
+            if player:
+                SHOTCHART_CACHE.set(make_cache_params(season, season_type, game_date, ALL_TEAMS, player), shotchart,
+                                    ttl=ttl)
+
+    return shots
+
+
+def run_prefetch_daemon(season: str, season_type: str, schedule_path: str=None, poll_interval: float=300,
+                        max_workers: int=4, once: bool=False):
+    """Prefetch shot charts for teams as their games end.
+
+    Every poll, each game date with teams whose games ended is pulled with one league-wide request,
+    and dates are prefetched concurrently. Games that may still change are refreshed each time their
+    cache entries expire, until a pass after they settle (see get_cache_ttl) caches them without expiry.
+
+    Args:
+        season (str): The season of the games.
+        season_type (str): The type of season of the games.
+        schedule_path (str, optional): Path of a schedule file. Defaults to the teams in the local store.
+        poll_interval (float, optional): Seconds between polls. Defaults to 300.
+        max_workers (int, optional): Maximum number of game dates prefetched concurrently. Defaults to 4.
+        once (bool, optional): Whether to run a single pass and return. Defaults to False.
+    """
+    # (game_date, team_id) -> (prefetched at, whether the cached charts are final)
+    prefetched = {}
+
+    while True:
+        now = time.time()
+
+        # Dates past the prefetch window are never due again
+        expired = datetime.now() - timedelta(days=PREFETCH_WINDOW + 1)
+        for key in [key for key in prefetched if datetime.strptime(key[0], '%m/%d/%Y') < expired]:
+            del prefetched[key]
+
+        units = []
+        for game_date, team in get_due_units(season, season_type, schedule_path):
+            key = (game_date, team['id'])
+            if key in prefetched:
+                prefetched_at, final = prefetched[key]
+                if final or now - prefetched_at < SHOT_CACHE_TTL:
+                    continue
+            units.append((game_date, team))
+
+        # One league-wide pull per game date serves every team whose game ended that day
+        due_teams = {}
+        for game_date, team in units:
+            due_teams.setdefault(game_date, []).append(team)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Whether a date is final is decided before its pull, so a pass caching with a TTL is never marked final
+            futures = {executor.submit(prefetch_date, season, season_type, game_date, date_teams):
+                       (game_date, date_teams, get_cache_ttl(game_date) is None)
+                       for game_date, date_teams in due_teams.items()}
+
+            for future in as_completed(futures):
+                game_date, date_teams, final = futures[future]
+                try:
+                    shots = future.result()
+                except Exception as e:
+                    print("ERROR: Unable to prefetch {} {}: {}".format(game_date, season_type, e))
+                    continue
+
+                for team in date_teams:
+                    print("Prefetched {} {} {}: {:,} shots".format(team['abbreviation'], game_date, season_type,
+                                                                   shots[team['id']]))
+                    prefetched[(game_date, team['id'])] = (time.time(), final)
+
+        if once:
+            return
+
+        time.sleep(poll_interval)
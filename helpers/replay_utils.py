@@ -0,0 +1,102 @@
+import argparse
+import json
+import os
+import tempfile
+import requests
+from urllib.parse import urlsplit
+from nba_api.stats.library.http import NBAStatsHTTP
+from classes.stats_server import StatsServer
+
+# Live Stats API Base URL
+STATS_BASE_URL = NBAStatsHTTP.base_url
+
+
+def record_response(response: requests.Response, fixtures_dir: str):
+    """Save a raw stats API response as a replayable fixture.
+
+    Fixtures are stored as '<fixtures_dir>/<endpoint>/<key>.json', keyed on the request's query
+    parameters exactly as sent, so the stand-in stats server finds them for identical requests.
+
+    Args:
+        response (requests.Response): Response returned by the stats API.
+        fixtures_dir (str): Directory in which fixtures are stored.
+    """
+    url = urlsplit(response.url)
+    endpoint = url.path.rstrip("/").rsplit("/", 1)[-1].lower()
+    fixture = {
+        "url": response.url,
+        "status_code": response.status_code,
+        "response": response.text
+    }
+
+    # Write atomically so a concurrent replay never reads a partial fixture
+    endpoint_dir = os.path.join(fixtures_dir, endpoint)
+    os.makedirs(endpoint_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=endpoint_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(fixture, f)
+    os.replace(tmp_path, os.path.join(endpoint_dir, StatsServer.make_fixture_key(url.query) + ".json"))
+
+
+def enable_record_mode(fixtures_dir: str):
+    """Record every successful stats API response (ShotChartDetail, CommonTeamRoster, ...) to fixtures.
+
+    Args:
+        fixtures_dir (str): Directory in which fixtures are stored.
+    """
+    def record_hook(response, *args, **kwargs):
+        if response.ok:
+            record_response(response, fixtures_dir)
+        return response
+
+    NBAStatsHTTP.get_session().hooks["response"].append(record_hook)
+
+
+def enable_replay_mode(fixtures_dir: str, latency: float=0, jitter: float=0, error_rate: float=0,
+                       seed: int=None) -> StatsServer:
+    """Start a local stand-in stats server over recorded fixtures and point every stats API request at it.
+
+    Args:
+        fixtures_dir (str): Directory of recorded fixtures.
+        latency (float, optional): Seconds added to every response.
+        jitter (float, optional): Maximum random seconds added on top of the latency.
+        error_rate (float, optional): Probability of answering a request with an error.
+        seed (int, optional): Seed for latency jitter and error injection.
+
+    Returns:
+        StatsServer: The running stand-in server.
+    """
+    server = StatsServer(fixtures_dir, latency=latency, jitter=jitter, error_rate=error_rate, seed=seed).start()
+    set_stats_base_url(server.base_url)
+
+    return server
+
+
+def set_stats_base_url(base_url: str=None):
+    """Point every stats API request at a different server.
+
+    Args:
+        base_url (str, optional): Base URL containing an '{endpoint}' placeholder. Defaults to the live stats API.
+    """
+    NBAStatsHTTP.base_url = base_url or STATS_BASE_URL
+
+
+def configure_replay(args: argparse.Namespace) -> StatsServer:
+    """Configure record, replay or stand-in server mode from command line arguments.
+
+    Args:
+        args (argparse.Namespace): Arguments containing the record/replay options (from argparse).
+
+    Returns:
+        StatsServer: The running stand-in server in replay mode, otherwise None.
+    """
+    if args.record:
+        enable_record_mode(args.record)
+
+    if args.stats_url:
+        set_stats_base_url(args.stats_url)
+    elif args.replay:
+        return enable_replay_mode(args.replay, latency=args.replay_latency, jitter=args.replay_jitter,
+                                  error_rate=args.replay_error_rate, seed=args.replay_seed)
+
+    return None
@@ -0,0 +1,188 @@
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from nba_api.stats.library.http import NBAStatsHTTP, NBAStatsResponse
+from classes.circuit_breaker import CircuitBreaker
+from classes.latency_histogram import LatencyHistogram
+from classes.rate_limiter import TokenBucket
+
+# Global Stats API Rate Limiter (shared by every thread issuing requests)
+STATS_RATE_LIMITER = TokenBucket(rate=2, capacity=5)
+
+# Request Resilience Settings
+REQUEST_SETTINGS = {
+    'timeout': 30,            # Seconds before a request attempt is abandoned
+    'retries': 4,             # Retries after the first failed attempt
+    'backoff_base': 0.5,      # Seconds of backoff before the first retry, doubled on every retry
+    'backoff_max': 30,        # Maximum seconds of backoff before any retry
+    'failure_threshold': 5,   # Consecutive failed requests that open an endpoint's circuit breaker
+    'reset_timeout': 30,      # Seconds an open circuit breaker rejects requests before a trial request
+    'pool_size': 16           # Keep-alive connections held open per host by the shared session
+}
+
+# HTTP statuses worth retrying (throttling and server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Per-Endpoint Circuit Breakers and Latency Histograms
+CIRCUIT_BREAKERS = {}
+LATENCY_HISTOGRAMS = {}
+ENDPOINT_LOCK = threading.Lock()
+
+
+def create_stats_session(pool_size: int) -> requests.Session:
+    """Create a keep-alive HTTP session with a connection pool sized for concurrent workers.
+
+    The pool blocks when every connection is checked out, so extra threads wait for a warm
+    connection instead of opening (and then discarding) a new one.
+
+    Args:
+        pool_size (int): Maximum number of pooled connections per host.
+
+    Returns:
+        requests.Session: The pooled session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def install_stats_session(pool_size: int) -> requests.Session:
+    """Install a pooled session as the process-wide session used by every nba_api endpoint.
+
+    Response hooks of the previous session (e.g. record mode) are carried over, and the previous
+    session's connections are closed.
+
+    Args:
+        pool_size (int): Maximum number of pooled connections per host.
+
+    Returns:
+        requests.Session: The installed session.
+    """
+    previous = NBAStatsHTTP._session
+    session = create_stats_session(pool_size)
+    if previous is not None:
+        session.hooks['response'].extend(previous.hooks['response'])
+        previous.close()
+
+    NBAStatsHTTP.set_session(session)
+    return session
+
+
+class StatsRequestError(Exception):
+    """Raised when a stats API request fails after every retry."""
+    pass
+
+
+def send_stats_request(endpoint) -> NBAStatsResponse:
+    """Send an nba_api endpoint request with timeouts, retries and a per-endpoint circuit breaker.
+
+    Failed attempts (connection errors, timeouts, throttling, server errors and invalid JSON) are
+    retried with exponential backoff and full jitter. Every attempt is recorded in the endpoint's
+    latency histogram. A request that fails every attempt counts against the endpoint's circuit
+    breaker; once the breaker opens, requests fail fast instead of waiting out their retries.
+
+    Args:
+        endpoint: An nba_api endpoint built with get_request=False (e.g. ShotChartDetail).
+
+    Returns:
+        NBAStatsResponse: The successful response.
+
+    Raises:
+        CircuitOpenError: If the endpoint's circuit breaker is open.
+        StatsRequestError: If every attempt failed, or the request was rejected as invalid.
+    """
+    breaker, histogram = get_endpoint_monitors(endpoint.endpoint)
+    breaker.before_call()
+
+    for attempt in range(REQUEST_SETTINGS['retries'] + 1):
+        STATS_RATE_LIMITER.acquire()
+
+        started = time.monotonic()
+        try:
+            response = NBAStatsHTTP().send_api_request(endpoint=endpoint.endpoint, parameters=endpoint.parameters,
+                                                       proxy=endpoint.proxy, headers=endpoint.headers,
+                                                       timeout=REQUEST_SETTINGS['timeout'])
+        except requests.RequestException as e:
+            error = e
+        else:
+            # nba_api only exposes the HTTP status through the response's private attribute
+            status_code = response._status_code
+            if status_code is not None and status_code >= 400 and status_code not in RETRY_STATUSES:
+                # The request itself is invalid; retrying cannot help and the endpoint is healthy
+                histogram.record(time.monotonic() - started, error=True)
+                breaker.record_success()
+                raise StatsRequestError("{} rejected the request with status {}.".format(endpoint.endpoint, status_code))
+
+            if status_code not in RETRY_STATUSES and response.valid_json():
+                histogram.record(time.monotonic() - started)
+                breaker.record_success()
+                return response
+
+            error = StatsRequestError("{} returned status {}.".format(endpoint.endpoint, status_code))
+
+        histogram.record(time.monotonic() - started, error=True)
+        if attempt == REQUEST_SETTINGS['retries']:
+            breaker.record_failure()
+            raise StatsRequestError("{} failed after {} attempts: {}".format(endpoint.endpoint, attempt + 1, error)) from error
+
+        # Exponential backoff with full jitter
+        backoff = min(REQUEST_SETTINGS['backoff_max'], REQUEST_SETTINGS['backoff_base'] * 2 ** attempt)
+        time.sleep(random.uniform(0, backoff))
+
+
+def get_endpoint_monitors(endpoint: str) -> tuple:
+    """Get the circuit breaker and latency histogram of an endpoint, creating them on first use.
+
+    Args:
+        endpoint (str): Name of the stats API endpoint.
+
+    Returns:
+        tuple: The endpoint's (CircuitBreaker, LatencyHistogram).
+    """
+    with ENDPOINT_LOCK:
+        if endpoint not in CIRCUIT_BREAKERS:
+            CIRCUIT_BREAKERS[endpoint] = CircuitBreaker(endpoint, failure_threshold=REQUEST_SETTINGS['failure_threshold'],
+                                                        reset_timeout=REQUEST_SETTINGS['reset_timeout'])
+            LATENCY_HISTOGRAMS[endpoint] = LatencyHistogram(endpoint)
+
+        return CIRCUIT_BREAKERS[endpoint], LATENCY_HISTOGRAMS[endpoint]
+
+
+def configure_requests(**settings):
+    """Override request settings (timeout, retries, backoff_base, backoff_max, pool_size, ...).
+
+    Raises:
+        KeyError: If a setting is unknown.
+    """
+    for key, value in settings.items():
+        if key not in REQUEST_SETTINGS:
+            raise KeyError("Unknown request setting: {}".format(key))
+        REQUEST_SETTINGS[key] = value
+
+    # Resize the shared connection pool
+    if 'pool_size' in settings:
+        install_stats_session(REQUEST_SETTINGS['pool_size'])
+
+
+def format_latency_histograms() -> str:
+    """Format the latency histogram of every endpoint requested so far."""
+    with ENDPOINT_LOCK:
+        histograms = list(LATENCY_HISTOGRAMS.values())
+
+    if not histograms:
+        return "No stats API requests recorded."
+
+    return "\n".join(histogram.format() for histogram in histograms)
+
+
+def dump_latency_histograms(*args):
+    """Print the latency histogram of every endpoint. Usable as a signal handler."""
+    print(format_latency_histograms(), flush=True)
+
+
+# Shared keep-alive session for every stats API request in the process
+install_stats_session(REQUEST_SETTINGS['pool_size'])
@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# ShotChartDetail Ingest Schema (column -> compact dtype)
+SHOTCHART_SCHEMA = {
+    'GRID_TYPE': 'category',
+    'GAME_ID': 'category',
+    'GAME_EVENT_ID': 'int32',
+    'PLAYER_ID': 'int32',
+    'PLAYER_NAME': 'category',
+    'TEAM_ID': 'int32',
+    'TEAM_NAME': 'category',
+    'PERIOD': 'int8',
+    'MINUTES_REMAINING': 'int8',
+    'SECONDS_REMAINING': 'int8',
+    'EVENT_TYPE': 'category',
+    'ACTION_TYPE': 'category',
+    'SHOT_TYPE': 'category',
+    'SHOT_ZONE_BASIC': 'category',
+    'SHOT_ZONE_AREA': 'category',
+    'SHOT_ZONE_RANGE': 'category',
+    'SHOT_DISTANCE': 'int16',
+    'LOC_X': 'int16',
+    'LOC_Y': 'int16',
+    'SHOT_ATTEMPTED_FLAG': 'int8',
+    'SHOT_MADE_FLAG': 'int8',
+    'GAME_DATE': 'datetime64[ns]',
+    'HTM': 'category',
+    'VTM': 'category'
+}
+
+SHOTCHART_COLUMNS = list(SHOTCHART_SCHEMA.keys())
+
+# Rows decoded per chunk when reading a ShotChartDetail rowSet
+DECODE_CHUNK_SIZE = 65536
+
+
+def decode_shotchart_payload(payload: dict, chunk_size: int=DECODE_CHUNK_SIZE) -> pd.DataFrame:
+    """Decode a raw ShotChartDetail payload straight into typed NumPy columns.
+
+    The rowSet is read column by column, one chunk of rows at a time, into preallocated arrays of
+    the SHOTCHART_SCHEMA dtypes. Strings are dictionary-encoded into categorical codes as they are
+    read, so no intermediate object-dtype DataFrame is ever built.
+
+    Args:
+        payload (dict): Parsed JSON response of the ShotChartDetail endpoint.
+        chunk_size (int, optional): Number of rows decoded per chunk. Bounds temporary memory.
+
+    Returns:
+        pd.DataFrame: DataFrame with exactly the SHOTCHART_COLUMNS, typed per SHOTCHART_SCHEMA.
+    """
+    result_sets = payload.get('resultSets') or payload.get('resultSet') or []
+    if isinstance(result_sets, dict):
+        result_sets = [result_sets]
+    result_set = next((result_set for result_set in result_sets if result_set['name'] == 'Shot_Chart_Detail'),
+                      {'headers': [], 'rowSet': []})
+
+    rows = result_set['rowSet']
+    positions = {header: i for i, header in enumerate(result_set['headers'])}
+    row_count = len(rows)
+
+    # Preallocate every column; strings are decoded to int32 codes against a growing category table
+    columns = {}
+    categories = {}
+    for column, dtype in SHOTCHART_SCHEMA.items():
+        if dtype in ('category', 'datetime64[ns]'):
+            columns[column] = np.full(row_count, -1, dtype=np.int32)
+            categories[column] = {}
+        else:
+            columns[column] = np.zeros(row_count, dtype=dtype)
+
+    for start in range(0, row_count, chunk_size):
+        chunk = rows[start:start + chunk_size]
+        end = start + len(chunk)
+
+        for column, values in columns.items():
+            position = positions.get(column)
+            if position is None:
+                continue
+
+            if column in categories:
+                table = categories[column]
+                values[start:end] = np.fromiter((table.setdefault(row[position], len(table)) for row in chunk),
+                                                dtype=np.int32, count=len(chunk))
+            else:
+                values[start:end] = np.fromiter((row[position] for row in chunk), dtype=values.dtype,
+                                                count=len(chunk))
+
+    # Wrap the arrays without copying: codes become categoricals, date codes index parsed dates
+    shotchart_columns = {}
+    for column, values in columns.items():
+        if SHOTCHART_SCHEMA[column] == 'category':
+            shotchart_columns[column] = pd.Categorical.from_codes(
+                values, categories=pd.Index(list(categories[column]), dtype=str), validate=False)
+        elif SHOTCHART_SCHEMA[column] == 'datetime64[ns]':
+            dates = pd.to_datetime(pd.Index(list(categories[column]), dtype=str), format='%Y%m%d')
+            shotchart_columns[column] = dates.values.astype('datetime64[ns]')[values] if row_count else \
+                np.array([], dtype='datetime64[ns]')
+        else:
+            shotchart_columns[column] = values
+
+    return pd.DataFrame(shotchart_columns, copy=False)
+
+
+def concat_shotchart_frames(frames: list) -> pd.DataFrame:
+    """Concatenate shot chart frames, keeping categorical columns categorical.
+
+    pandas falls back to object dtype when categoricals with different categories are concatenated,
+    so categorical columns are unioned first.
+
+    Args:
+        frames (list): DataFrames with the same columns.
+
+    Returns:
+        pd.DataFrame: The concatenated DataFrame.
+    """
+    merged = pd.concat(frames, ignore_index=True)
+    for column in frames[0].columns:
+        if all(column in frame.columns and isinstance(frame[column].dtype, pd.CategoricalDtype) for frame in frames):
+            merged[column] = union_categoricals([frame[column] for frame in frames])
+
+    return merged
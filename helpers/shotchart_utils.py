@@ -1,65 +1,648 @@
 import argparse
+import asyncio
+import json
+import os
+import time
+import weakref
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from classes.league_shot_index import LeagueShotIndex
+from classes.player_index import PlayerIndex
+from classes.response_archive import ResponseArchive
+from classes.shot_cache import ShotCache
+from classes.shot_warehouse import ShotWarehouse
 from classes.shotchart import ShotChart
-from datetime import datetime, timedelta
+from classes.single_flight import SingleFlight
+from classes.team_index import TeamIndex
+from classes.trigram_index import TrigramIndex
+from datetime import date, datetime, timedelta
+from classes.circuit_breaker import CircuitOpenError
+from helpers.request_utils import StatsRequestError
+from helpers.request_utils import send_stats_request
+from helpers.schema_utils import concat_shotchart_frames, decode_shotchart_payload
 from nba_api.stats.endpoints import commonteamroster, shotchartdetail
-from nba_api.stats.static import players, teams
+from nba_api.stats.static import players
 
 CURRENT_SEASON = "2020-21"
+SEASON_TYPES = ('Pre Season', 'Regular Season', 'All Star', 'Playoffs')
 
+# Local Data Directories
+DATA_DIR = os.environ.get("NBA_SHOT_CHARTS_DIR", os.path.join(os.path.expanduser("~"), ".nba_shot_charts"))
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+WAREHOUSE_DIR = os.path.join(DATA_DIR, "warehouse")
+ARCHIVE_DIR = os.path.join(DATA_DIR, "archive")
 
-def fetch_shotchart_data(season: str, season_type: str, game_date: str, team: dict, player: dict) -> pd.DataFrame:
+# Shot Cache (1 hour TTL for games that may still change, 512 MB LRU bound)
+SHOT_CACHE_TTL = 60 * 60
+SHOT_CACHE = ShotCache(os.path.join(CACHE_DIR, "shots"), ttl=SHOT_CACHE_TTL, max_bytes=512 * 1024 * 1024)
+
+# Hours after the midnight following a game date before its games are final (late games, stat corrections)
+GAME_SETTLE_DELAY = 6
+
+# Processed ShotChart Cache (aggregates precomputed by the prefetch daemon or earlier requests)
+SHOTCHART_CACHE = ShotCache(os.path.join(CACHE_DIR, "shotcharts"), ttl=SHOT_CACHE_TTL, max_bytes=128 * 1024 * 1024)
+
+# Player Name Index (normalized full name -> player records, persisted)
+PLAYER_INDEX = PlayerIndex(os.path.join(CACHE_DIR, "player_index.pkl"))
+
+# Team Index (abbreviation, full name, nickname, city and historical names -> team)
+TEAM_INDEX = TeamIndex()
+
+# Fuzzy Player and Team Name Search (built on first search)
+PLAYER_SEARCH = TrigramIndex(lambda: [(player['full_name'], player) for player in
+                                      sorted(players.get_players(), key=lambda data: (not data['is_active'], -data['id']))],
+                             normalize=PlayerIndex.normalize)
+TEAM_SEARCH = TrigramIndex(lambda: TEAM_INDEX.entries(), normalize=PlayerIndex.normalize)
+
+# Team Roster Cache (rosters of the ongoing season refresh daily, past seasons never expire)
+ROSTER_CACHE_TTL = 24 * 60 * 60
+ROSTER_CACHE = ShotCache(os.path.join(CACHE_DIR, "rosters"), ttl=ROSTER_CACHE_TTL, max_bytes=32 * 1024 * 1024)
+
+# In-Memory Team Rosters ((team_id, season) -> (expires, roster DataFrame))
+TEAM_ROSTERS = {}
+
+# Shot Warehouse (Parquet partitioned by season, season type and team)
+SHOT_WAREHOUSE = ShotWarehouse(WAREHOUSE_DIR)
+
+# Raw ShotChartDetail Response Archive (content-addressed, compressed, deduplicated)
+SHOT_ARCHIVE = ResponseArchive(ARCHIVE_DIR)
+
+# In-Flight Shot Chart Downloads (coalesces concurrent identical requests)
+SHOT_FLIGHTS = SingleFlight()
+
+# In-Flight Team Roster Requests (coalesces concurrent identical requests)
+ROSTER_FLIGHTS = SingleFlight()
+
+# Pseudo-team of a request across every team (team_id=0)
+ALL_TEAMS = {'id': 0, 'full_name': 'every team', 'abbreviation': 'NBA'}
+
+# Maximum concurrent fetches per event loop for the async fetch API
+ASYNC_FETCH_LIMIT = 8
+FETCH_SEMAPHORES = weakref.WeakKeyDictionary()
+
+
+def fetch_shotchart_data(season: str, season_type: str, game_date: str, team: dict, player: dict,
+                         use_cache: bool=True, columns: list=None, date_from: str=None,
+                         date_to: str=None) -> pd.DataFrame:
     """Fetch shot chart data for a specific player or team and create a DataFrame.
 
+    A date range fetches every game in the range with a single request.
+
     Args:
         season (str): The season in which the game was played.
         season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
         game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
         team (dict): A dictionary containing information about the team.
         player (dict): A dictionary containing information about the player.
+        use_cache (bool, optional): Whether to read from and write to the shot cache. Defaults to True.
+        columns (list, optional): Columns to return. Defaults to every column.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
 
     Returns:
         pandas.DataFrame: DataFrame containing shot chart data.
 
     Raises:
-        SystemExit: If no shot chart data is found for the specified team and date.
+        SystemExit: If no shot chart data is found for the specified team and date, or the request failed.
+    """
+    try:
+        shotchart_df = load_shotchart_data(season, season_type, game_date, team, player, use_cache=use_cache,
+                                           columns=columns, date_from=date_from, date_to=date_to)
+    except (StatsRequestError, CircuitOpenError) as e:
+        exit("ERROR: Unable to fetch shot chart for {}: {}".format(team['full_name'], e))
+
+    # Return the DataFrame shotchart endpoint if found. Else, exit.
+    if not shotchart_df.empty:
+        return shotchart_df
+    else:
+        exit(format_no_shotchart(team['full_name'], season, game_date, date_from, date_to))
+
+
+async def fetch_shotchart_data_async(season: str, season_type: str, game_date: str, team: dict, player: dict,
+                                     use_cache: bool=True, columns: list=None, date_from: str=None,
+                                     date_to: str=None) -> pd.DataFrame:
+    """Asynchronously fetch shot chart data for a specific player or team.
+
+    The blocking fetch runs on a worker thread while holding the event loop's fetch semaphore, so
+    any number of concurrent callers share at most ASYNC_FETCH_LIMIT threads. Unlike
+    fetch_shotchart_data, an empty DataFrame is returned instead of exiting when no shots are found.
+
+    Args:
+        season (str): The season in which the game was played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
+        team (dict): A dictionary containing information about the team.
+        player (dict): A dictionary containing information about the player.
+        use_cache (bool, optional): Whether to read from and write to the shot cache. Defaults to True.
+        columns (list, optional): Columns to return. Defaults to every column.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+
+    Returns:
+        pandas.DataFrame: DataFrame containing shot chart data. Empty if no shots were found.
+    """
+    async with get_fetch_semaphore():
+        return await asyncio.to_thread(load_shotchart_data, season, season_type, game_date, team, player,
+                                       use_cache=use_cache, columns=columns, date_from=date_from,
+                                       date_to=date_to)
+
+
+def load_shotchart_data(season: str, season_type: str, game_date: str, team: dict, player: dict,
+                        use_cache: bool=True, columns: list=None, date_from: str=None,
+                        date_to: str=None) -> pd.DataFrame:
+    """Load shot chart data for a specific player or team from the fastest available source.
+
+    Shots are read from the local shot warehouse first, then from the on-disk shot cache, and
+    only then requested from the API. Team-wide API responses are written back to the warehouse,
+    except games played today, which may still be in progress. Cached shots from completed past
+    games never expire; anything that may still change uses the cache TTL.
+
+    Several season types are loaded concurrently, one source lookup per season type, and merged
+    into one frame with a SEASON_TYPE column.
+
+    Args:
+        season (str): The season in which the game was played.
+        season_type (str | list): One or more season types ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
+        team (dict): A dictionary containing information about the team.
+        player (dict): A dictionary containing information about the player.
+        use_cache (bool, optional): Whether to read stored or cached shots and write to the shot cache. Defaults to True.
+        columns (list, optional): Columns to return. Defaults to every column.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+
+    Returns:
+        pandas.DataFrame: DataFrame containing shot chart data. Empty if no shots were found.
+    """
+    season_types = [season_type] if isinstance(season_type, str) else list(season_type)
+    if len(season_types) > 1:
+        return load_season_types_data(season, season_types, game_date, team, player, use_cache=use_cache,
+                                      columns=columns, date_from=date_from, date_to=date_to)
+    season_type = season_types[0]
+
+    cache_params = make_cache_params(season, season_type, game_date, team, player, date_from, date_to)
+    player_id, date_from, date_to = cache_params['player_id'], cache_params['date_from'], cache_params['date_to']
+
+    # Return stored shots if the warehouse holds every game in the range (league-wide pulls span every
+    # team's partition, so one stored team never stands in for the league)
+    if use_cache and date_from and team['id'] and SHOT_WAREHOUSE.available:
+        warehouse_from = datetime.strptime(date_from, '%m/%d/%Y').strftime('%Y%m%d')
+        warehouse_to = datetime.strptime(date_to, '%m/%d/%Y').strftime('%Y%m%d') if date_to else None
+        covered = warehouse_to and SHOT_WAREHOUSE.covers(season, season_type, team['id'], warehouse_to)
+
+        shotchart_df = SHOT_WAREHOUSE.read(season, season_type, team_id=team['id'], columns=columns,
+                                           date_from=warehouse_from, date_to=warehouse_to,
+                                           player_id=player_id)
+        if covered or (date_from == date_to and not shotchart_df.empty):
+            return shotchart_df
+
+    # Return cached shot chart if found
+    shotchart_df = SHOT_CACHE.get(cache_params) if use_cache else None
+    if shotchart_df is not None:
+        return shotchart_df[columns] if columns else shotchart_df
+
+    # Concurrent identical requests share a single in-flight download
+    shotchart_df = SHOT_FLIGHTS.do(SHOT_CACHE.make_key(cache_params), download_shotchart_data,
+                                   cache_params, use_cache=use_cache)
+    if shotchart_df.empty:
+        return shotchart_df
+
+    return shotchart_df[columns] if columns else shotchart_df
+
+
+def load_season_types_data(season: str, season_types: list, game_date: str, team: dict, player: dict,
+                           use_cache: bool=True, columns: list=None, date_from: str=None,
+                           date_to: str=None) -> pd.DataFrame:
+    """Load several season types concurrently and merge them into one frame with a SEASON_TYPE column.
+
+    Args:
+        season (str): The season in which the games were played.
+        season_types (list): The types of season to load.
+        game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
+        team (dict): A dictionary containing information about the team.
+        player (dict): A dictionary containing information about the player.
+        use_cache (bool, optional): Whether to read from and write to the shot cache. Defaults to True.
+        columns (list, optional): Columns to return, besides SEASON_TYPE. Defaults to every column.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+
+    Returns:
+        pandas.DataFrame: DataFrame containing every season type's shots. Empty if no shots were found.
+    """
+    with ThreadPoolExecutor(max_workers=len(season_types)) as executor:
+        frames = list(executor.map(
+            lambda season_type: load_shotchart_data(season, season_type, game_date, team, player, use_cache=use_cache,
+                                                    columns=columns, date_from=date_from, date_to=date_to),
+            season_types))
+
+    # Tag each frame with its season type, so aggregations can split or combine them
+    frames = [shotchart_df.assign(SEASON_TYPE=pd.Categorical([season_type] * len(shotchart_df), categories=season_types))
+              for season_type, shotchart_df in zip(season_types, frames) if not shotchart_df.empty]
+    if not frames:
+        return pd.DataFrame(columns=(columns or []) + ['SEASON_TYPE'])
+
+    return concat_shotchart_frames(frames)
+
+
+def make_cache_params(season: str, season_type: str, game_date: str, team: dict, player: dict, date_from: str=None,
+                      date_to: str=None) -> dict:
+    """Build the parameter set identifying a shot chart request in the shot and ShotChart caches.
+
+    Args:
+        season (str): The season in which the game was played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
+        team (dict): A dictionary containing information about the team.
+        player (dict): A dictionary containing information about the player, or 0 for the whole team.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+
+    Returns:
+        dict: The player_id, team_id, season, season_type, date_from and date_to of the request.
+    """
+    # A single game date is a one-day range
+    if not date_from and not date_to:
+        date_from = date_to = game_date
+
+    # A single season type passed on the command line arrives as a one-item list
+    season_types = [season_type] if isinstance(season_type, str) else list(season_type)
+
+    return {
+        'player_id': player['id'] if player else 0,
+        'team_id': team['id'],
+        'season': season,
+        'season_type': season_types[0] if len(season_types) == 1 else season_types,
+        'date_from': date_from,
+        'date_to': date_to
+    }
+
+
+def fetch_processed_shotchart(season: str, season_type: str, game_date: str, team: dict, player: dict,
+                              use_cache: bool=True, date_from: str=None, date_to: str=None,
+                              **aggregates) -> ShotChart:
+    """Fetch a ShotChart with the requested aggregates processed.
+
+    Args:
+        season (str): The season in which the game was played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
+        team (dict): A dictionary containing information about the team.
+        player (dict): A dictionary containing information about the player, or 0 for the whole team.
+        use_cache (bool, optional): Whether to read from and write to the caches. Defaults to True.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        **aggregates: Flags passed to ShotChart.process (zones, points, shot_type, ...).
+
+    Returns:
+        ShotChart: The processed shot chart.
+
+    Raises:
+        SystemExit: If no shot chart data is found for the specified team and date, or the request failed.
+    """
+    name = player['full_name'] if player and 'full_name' in player else team['full_name']
+    try:
+        shotchart = load_processed_shotchart(season, season_type, game_date, team, player, use_cache=use_cache,
+                                             date_from=date_from, date_to=date_to, **aggregates)
+    except (StatsRequestError, CircuitOpenError) as e:
+        exit("ERROR: Unable to fetch shot chart for {}: {}".format(name, e))
+
+    if shotchart is None:
+        exit(format_no_shotchart(name, season, game_date, date_from, date_to))
+
+    return shotchart
+
+
+def load_processed_shotchart(season: str, season_type: str, game_date: str, team: dict, player: dict,
+                             use_cache: bool=True, date_from: str=None, date_to: str=None,
+                             **aggregates) -> ShotChart:
+    """Load a ShotChart with the requested aggregates processed.
+
+    Charts precomputed by the prefetch daemon (or by an earlier request) are served straight from
+    the ShotChart cache; only aggregates they lack are processed, and the result is cached again.
+
+    Args:
+        season (str): The season in which the game was played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
+        team (dict): A dictionary containing information about the team.
+        player (dict): A dictionary containing information about the player, or 0 for the whole team.
+        use_cache (bool, optional): Whether to read from and write to the caches. Defaults to True.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        **aggregates: Flags passed to ShotChart.process (zones, points, shot_type, ...).
+
+    Returns:
+        ShotChart: The processed shot chart, or None if no shots were found.
+
+    Raises:
+        StatsRequestError: If the request failed after every retry.
+        CircuitOpenError: If the ShotChartDetail circuit breaker is open.
+    """
+    cache_params = make_cache_params(season, season_type, game_date, team, player, date_from, date_to)
+
+    shotchart = SHOTCHART_CACHE.get(cache_params) if use_cache else None
+    if shotchart is None:
+        shotchart_df = load_shotchart_data(season, season_type, game_date, team, player, use_cache=use_cache,
+                                           columns=ShotChart.COLUMNS, date_from=date_from, date_to=date_to)
+        if shotchart_df.empty:
+            return None
+        shotchart = ShotChart(shotchart_df=shotchart_df)
+
+    processed = set(shotchart.processed)
+    shotchart.process(**aggregates)
+    if use_cache and shotchart.processed != processed:
+        SHOTCHART_CACHE.set(cache_params, shotchart, ttl=get_cache_ttl(cache_params['date_to']))
+
+    return shotchart
+
+
+def fetch_player_shotcharts(season: str, season_type: str, game_date: str, team: dict, player_names: list,
+                            use_cache: bool=True, date_from: str=None, date_to: str=None,
+                            **aggregates) -> list:
+    """Resolve and fetch several players' processed ShotCharts concurrently.
+
+    Players on the given team's roster are fetched with the team; any other player (or every
+    player, without a team) is fetched across every team, so players from different teams can be
+    compared in one run. A player without shots, or whose fetch failed, is reported and skipped.
+
+    Args:
+        season (str): The season in which the game was played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        game_date (str): The date on which the game was played in the format 'mm/dd/yyyy'.
+        team (dict): A dictionary containing information about the players' team, or None.
+        player_names (list): Full names of the players.
+        use_cache (bool, optional): Whether to read from and write to the caches. Defaults to True.
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'. Overrides game_date.
+        **aggregates: Flags passed to ShotChart.process (zones, points, shot_type, ...).
+
+    Returns:
+        list: One processed ShotChart per player with shots, in the order the players were given.
+    """
+    def fetch_player_shotchart(player_name: str) -> ShotChart:
+        player = get_player_info(player_name, team, season)
+        player_team = team if team and is_on_roster(player, team, season) else ALL_TEAMS
+        try:
+            shotchart = load_processed_shotchart(season, season_type, game_date, player_team, player,
+                                                 use_cache=use_cache, date_from=date_from, date_to=date_to,
+                                                 **aggregates)
+        except (StatsRequestError, CircuitOpenError) as e:
+            print("ERROR: Unable to fetch shot chart for {}: {}".format(player['full_name'], e))
+            return None
+
+        if shotchart is None:
+            print(format_no_shotchart(player['full_name'], season, game_date, date_from, date_to))
+        return shotchart
+
+    with ThreadPoolExecutor(max_workers=min(len(player_names), ASYNC_FETCH_LIMIT)) as executor:
+        return [shotchart for shotchart in executor.map(fetch_player_shotchart, player_names) if shotchart]
+
+
+def is_on_roster(player: dict, team: dict, season: str=CURRENT_SEASON) -> bool:
+    """Check whether a player is on a team's roster for a season.
+
+    Args:
+        player (dict): A dictionary containing information about the player.
+        team (dict): A dictionary containing information about the team.
+        season (str, optional): The season of the roster. Defaults to CURRENT_SEASON.
+
+    Returns:
+        bool: True if the player is on the roster. False if not, or if the roster is unavailable.
+    """
+    try:
+        roster_df = get_team_info_dataframe(team['id'], season)
+    except (ValueError, StatsRequestError, CircuitOpenError):
+        return False
+
+    return not roster_df.empty and int(player['id']) in set(roster_df['PLAYER_ID'].astype(int))
+
+
+def format_no_shotchart(name: str, season: str, game_date: str, date_from: str=None, date_to: str=None) -> str:
+    """Format the message reporting that a team or player has no shots in a date or date range."""
+    if date_from or date_to:
+        return "No shot chart found for {} from {} to {}.".format(name, date_from or season, date_to or 'today')
+    return "No shot chart found for {} on {}.".format(name, game_date)
+
+
+def download_shotchart_data(cache_params: dict, use_cache: bool=True) -> pd.DataFrame:
+    """Request shot chart data from the API and store it in the shot cache and warehouse.
+
+    Args:
+        cache_params (dict): The player_id, team_id, season, season_type, date_from and date_to of the request.
+        use_cache (bool, optional): Whether to write the response to the shot cache. Defaults to True.
+
+    Returns:
+        pandas.DataFrame: DataFrame containing shot chart data. Empty if no shots were found.
+    """
+    player_id, season, season_type = cache_params['player_id'], cache_params['season'], cache_params['season_type']
+
+    shotchart_df = request_shotchart_data(player_id, cache_params['team_id'], season, season_type,
+                                          cache_params['date_from'], cache_params['date_to'])
+    if shotchart_df.empty:
+        return shotchart_df
+
+    if use_cache:
+        SHOT_CACHE.set(cache_params, shotchart_df, ttl=get_cache_ttl(cache_params['date_to']))
+
+    # Store team-wide shots, which hold every shot of each game, in the warehouse once the games are over
+    if not player_id and SHOT_WAREHOUSE.available:
+        SHOT_WAREHOUSE.write(get_final_shots(shotchart_df), season, season_type)
+
+    return shotchart_df
+
+
+def request_shotchart_data(player_id: int, team_id: int, season: str, season_type: str, date_from: str=None,
+                           date_to: str=None) -> pd.DataFrame:
+    """Request shot chart data from the ShotChartDetail API endpoint.
+
+    Args:
+        player_id (int): The unique identifier of the player, or 0 for every player.
+        team_id (int): The unique identifier of the team.
+        season (str): The season in which the games were played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'.
+
+    Returns:
+        pandas.DataFrame: DataFrame containing shot chart data in the ingest schema. Empty if no shots were found.
+
+    Raises:
+        StatsRequestError: If the request failed after every retry.
+        CircuitOpenError: If the ShotChartDetail circuit breaker is open.
     """
-    # Define ShotChart Dataframe Columns
-    shotchart_columns = ['GRID_TYPE', 'GAME_ID', 'GAME_EVENT_ID', 'PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_NAME', 'PERIOD',
-                        'MINUTES_REMAINING', 'SECONDS_REMAINING', 'EVENT_TYPE', 'ACTION_TYPE', 'SHOT_TYPE', 'SHOT_ZONE_BASIC',
-                        'SHOT_ZONE_AREA', 'HOT_ZONE_RANGE', 'SHOT_DISTANCE', 'LOC_X', 'LOC_Y', 'SHOT_ATTEMPTED_FLAG', 'SHOT_MADE_FLAG',
-                        'GAME_DATE', 'HTM', 'VTM']
+    shotchart_body = request_shotchart_body(player_id, team_id, season, season_type, date_from, date_to)
+
+    # Decode the payload straight into typed columns
+    return decode_shotchart_payload(json.loads(shotchart_body))
+
 
-    # Create ShotChart Dataframe with Specified Columns
-    shotchart_df = pd.DataFrame(columns=shotchart_columns)
+def request_shotchart_body(player_id: int, team_id: int, season: str, season_type: str, date_from: str=None,
+                           date_to: str=None) -> str:
+    """Request the raw ShotChartDetail response body and archive it.
 
-    # Call ShotChartDetail API Endpoint
-    player_id = player['id'] if player else 0
-    shotchart_endpoint = shotchartdetail.ShotChartDetail(player_id=player_id, team_id=team['id'],
+    Args:
+        player_id (int): The unique identifier of the player, or 0 for every player.
+        team_id (int): The unique identifier of the team.
+        season (str): The season in which the games were played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        date_from (str, optional): Earliest game date in the format 'mm/dd/yyyy'.
+        date_to (str, optional): Latest game date in the format 'mm/dd/yyyy'.
+
+    Returns:
+        str: The raw JSON response body.
+
+    Raises:
+        StatsRequestError: If the request failed after every retry.
+        CircuitOpenError: If the ShotChartDetail circuit breaker is open.
+    """
+    # Build the ShotChartDetail API request without letting nba_api build its own data sets
+    shotchart_endpoint = shotchartdetail.ShotChartDetail(player_id=player_id, team_id=team_id,
                                                          season_type_all_star=season_type, season_nullable=season,
                                                          context_measure_simple='FGA',
-                                                         date_from_nullable=game_date)
+                                                         date_from_nullable=date_from,
+                                                         date_to_nullable=date_to,
+                                                         get_request=False)
 
-    # Convert ShotChartDetail Endpoint to DataFrame
-    endpoint_df = shotchart_endpoint.get_data_frames()[0]
+    # Call ShotChartDetail API Endpoint (rate limited, with timeouts, retries and a circuit breaker)
+    shotchart_response = send_stats_request(shotchart_endpoint)
 
-    # Concatenate endpoint_df with shotchart_df
-    shotchart_df = pd.concat([shotchart_df, endpoint_df], ignore_index=True)
+    # Keep the raw payload so the warehouse can be rebuilt without touching the network
+    shotchart_body = shotchart_response.get_response()
+    SHOT_ARCHIVE.put(shotchart_endpoint.endpoint, shotchart_endpoint.parameters, shotchart_body)
 
-    # Return the DataFrame shotchart endpoint if found. Else, exit.
-    if not endpoint_df.empty:
-        return shotchart_df
-    else:
-        exit("No shot chart found for {} on {}.".format(team['full_name'], game_date))
+    return shotchart_body
+
+
+def get_cache_ttl(date_to: str) -> float:
+    """Get the shot cache time-to-live for a request.
+
+    Games are final once GAME_SETTLE_DELAY hours have passed after the following midnight, so
+    late games and early stat corrections are in; their shots are then cached without expiry.
+
+    Args:
+        date_to (str): Latest game date of the request in the format 'mm/dd/yyyy'.
+
+    Returns:
+        float: Time-to-live in seconds, or None if the entry should never expire.
+    """
+    if date_to:
+        played = datetime.strptime(date_to, '%m/%d/%Y').date()
+        if played < get_settled_date():
+            return None
+    return SHOT_CACHE_TTL
+
+
+def get_settled_date(now: datetime=None) -> date:
+    """Get the first date whose games may still be in progress or changing; every earlier date is final.
+
+    Args:
+        now (datetime, optional): The time the games are judged at. Defaults to now.
+    """
+    return ((now or datetime.now()) - timedelta(hours=GAME_SETTLE_DELAY)).date()
+
+
+def get_final_shots(shotchart_df: pd.DataFrame, now: datetime=None) -> pd.DataFrame:
+    """Keep only the shots of games that are final (see get_cache_ttl).
+
+    The warehouse never rewrites a stored game outside revalidation, so games that may still be in
+    progress must not be stored.
+
+    Args:
+        shotchart_df (pd.DataFrame): DataFrame of shots.
+        now (datetime, optional): The time the shots were fetched. Defaults to now.
+
+    Returns:
+        pd.DataFrame: The shots of completed games.
+    """
+    return shotchart_df[shotchart_df['GAME_DATE'] < pd.Timestamp(get_settled_date(now))]
+
+
+def invalidate_cached_games(season: str, season_type: str, team_id: int, game_dates: list) -> int:
+    """Drop cached shots and processed ShotCharts that include any of a team's games.
+
+    Team, player and league-wide entries whose date range covers one of the games are removed, so
+    the next request reads the corrected games.
+
+    Args:
+        season (str): The season of the games.
+        season_type (str): The type of season of the games.
+        team_id (int): The unique identifier of the team.
+        game_dates (list): Dates of the games in the format 'YYYYMMDD'.
+
+    Returns:
+        int: Number of cache entries removed.
+    """
+    game_dates = [datetime.strptime(game_date, '%Y%m%d') for game_date in game_dates]
+
+    def includes_games(params: dict) -> bool:
+        season_types = [params['season_type']] if isinstance(params['season_type'], str) else params['season_type']
+        if params['season'] != season or season_type not in season_types or params['team_id'] not in (team_id, 0):
+            return False
+
+        date_from = datetime.strptime(params['date_from'], '%m/%d/%Y') if params['date_from'] else datetime.min
+        date_to = datetime.strptime(params['date_to'], '%m/%d/%Y') if params['date_to'] else datetime.max
+        return any(date_from <= game_date <= date_to for game_date in game_dates)
+
+    return SHOT_CACHE.invalidate(includes_games) + SHOTCHART_CACHE.invalidate(includes_games)
+
+
+def fetch_league_shotchart_data(season: str, season_type: str, game_date: str,
+                                use_cache: bool=True, columns: list=None) -> LeagueShotIndex:
+    """Fetch every shot in the league on a game date with one request and index it by team and player.
+
+    A single team_id=0 request replaces one request per team; every team and player ShotChart for
+    the date is then served from memory.
+
+    Args:
+        season (str): The season in which the games were played.
+        season_type (str): The type of season ('Pre Season', 'Regular Season', 'All Star', 'Playoffs').
+        game_date (str): The date on which the games were played in the format 'mm/dd/yyyy'.
+        use_cache (bool, optional): Whether to read from and write to the shot cache. Defaults to True.
+        columns (list, optional): Columns to index, including TEAM_ID and PLAYER_ID. Defaults to every column.
+
+    Returns:
+        LeagueShotIndex: Index of the league-wide shots. Empty if no games were played.
+    """
+    shotchart_df = load_shotchart_data(season, season_type, game_date, ALL_TEAMS, 0, use_cache=use_cache,
+                                       columns=columns)
+
+    return LeagueShotIndex(shotchart_df)
 
 
-def get_player_info(player: str) -> dict:
+def split_shotchart_by_player(shotchart_df: pd.DataFrame, roster_df: pd.DataFrame=None) -> dict:
+    """Partition a team-wide shot chart into one ShotChart per player.
+
+    A team query (player_id=0) already holds every player's shots, so a whole roster is charted
+    from one request and a single groupby instead of one request per player.
+
+    Args:
+        shotchart_df (pd.DataFrame): DataFrame containing a team's shot chart data.
+        roster_df (pd.DataFrame, optional): The team's roster, used to order the charts.
+
+    Returns:
+        dict: ShotChart objects keyed by player ID, in roster order (players no longer on the roster
+            last), or in order of each player's first shot without a roster.
+    """
+    shotcharts = {player_id: ShotChart(shotchart_df=player_df)
+                  for player_id, player_df in shotchart_df.groupby('PLAYER_ID', sort=False)}
+    if roster_df is None or roster_df.empty:
+        return shotcharts
+
+    roster_ids = [player_id for player_id in roster_df['PLAYER_ID'] if player_id in shotcharts]
+    return {player_id: shotcharts[player_id]
+            for player_id in roster_ids + [player_id for player_id in shotcharts if player_id not in roster_ids]}
+
+
+def get_player_info(player: str, team: dict=None, season: str=CURRENT_SEASON) -> dict:
     """Get information about an NBA player by full name.
 
     This function retrieves player information using the NBA API based on the provided player's full name.
+    When a team is given, the player is first looked up on the team's cached roster for the season.
 
     Parameters:
         player (str): Full name of the NBA player.
+        team (dict, optional): A dictionary containing information about the player's team.
+        season (str, optional): The season of the team's roster. Defaults to CURRENT_SEASON.
 
     Returns:
         dict: A dictionary containing the player's information if found.
@@ -67,24 +650,80 @@ def get_player_info(player: str) -> dict:
     Raises:
         SystemExit: If the player information is not found, the script exits with an error message.
     """
-    player_info = {}
-
-    # Retrieve player information from the NBA API
-    for data in players.find_players_by_full_name(player):
-        player_info.update(data)
-    
-    # Return the player if found. Else, exit.
+    # Resolve the player on the team's roster, which also knows players missing from the static list
+    if team:
+        try:
+            roster_df = get_team_info_dataframe(team['id'], season)
+        except (ValueError, StatsRequestError, CircuitOpenError):
+            roster_df = pd.DataFrame()
+
+        if not roster_df.empty:
+            matches = roster_df[roster_df['PLAYER'].map(PlayerIndex.normalize) == PlayerIndex.normalize(player)]
+            if not matches.empty:
+                return {'id': int(matches.iloc[0]['PLAYER_ID']), 'full_name': matches.iloc[0]['PLAYER']}
+
+    # Resolve the exact (case- and accent-insensitive) name with the player index
+    player_info = PLAYER_INDEX.get(player)
+
+    # Fall back to a fuzzy match (typos), only when it is close and clearly the best
+    suggestions = []
+    if not player_info:
+        player_info, suggestions = PLAYER_SEARCH.resolve(player)
+        if player_info:
+            print("Assuming {} for '{}'.".format(player_info['full_name'], player))
+
+    # Return the player if found. Else, exit with the closest names.
     if player_info:
         return player_info
+    elif suggestions:
+        exit("Unable to find player '{}'. Did you mean: {}?".format(
+            player, ", ".join(data['full_name'] for _, data in suggestions)))
     else:
         exit("Unable to find player. Please try again.")
 
 
-def get_team_info_dataframe(team_id: int, season: str=CURRENT_SEASON) -> pd.DataFrame:
+def get_team_info_dataframe(team_id: int, season: str=CURRENT_SEASON, use_cache: bool=True) -> pd.DataFrame:
     """Get information about an NBA team as a Pandas DataFrame.
 
     This function retrieves team information using the NBA API based on the provided team ID and season.
-    The information is returned as a Pandas DataFrame.
+    The information is returned as a Pandas DataFrame. Rosters are cached per (team_id, season) in memory
+    and on disk, so only the first request of a season reaches the network.
+
+    Parameters:
+        team_id (int): The unique identifier of the NBA team.
+        season (str, optional): The season for which the information is desired. Defaults to CURRENT_SEASON.
+        use_cache (bool, optional): Whether to read from and write to the roster cache. Defaults to True.
+
+    Returns:
+        pd.DataFrame: A Pandas DataFrame containing the team's information.
+
+    Raises:
+        ValueError: If the provided team_id is invalid or if no data is available for the specified team and season.
+    """
+    if not use_cache:
+        return request_team_info_dataframe(team_id, season)
+
+    # Return the in-memory roster if still fresh
+    roster = TEAM_ROSTERS.get((team_id, season))
+    if roster and (roster[0] is None or roster[0] > time.time()):
+        return roster[1]
+
+    ttl = ROSTER_CACHE_TTL if season == CURRENT_SEASON else None
+    roster_params = {'team_id': team_id, 'season': season}
+
+    # Fall back to the on-disk roster, then to a single shared request
+    dfTeam = ROSTER_CACHE.get(roster_params)
+    if dfTeam is None:
+        dfTeam = ROSTER_FLIGHTS.do(ROSTER_CACHE.make_key(roster_params), request_team_info_dataframe, team_id, season)
+        ROSTER_CACHE.set(roster_params, dfTeam, ttl=ttl)
+
+    TEAM_ROSTERS[(team_id, season)] = (None if ttl is None else time.time() + ttl, dfTeam)
+
+    return dfTeam
+
+
+def request_team_info_dataframe(team_id: int, season: str=CURRENT_SEASON) -> pd.DataFrame:
+    """Request a team's roster from the CommonTeamRoster API endpoint.
 
     Parameters:
         team_id (int): The unique identifier of the NBA team.
@@ -98,7 +737,9 @@ def get_team_info_dataframe(team_id: int, season: str=CURRENT_SEASON) -> pd.Data
     """
     try:
         # Retrieve team information from the NBA API
-        team_info = commonteamroster.CommonTeamRoster(team_id=team_id, season=season)
+        team_info = commonteamroster.CommonTeamRoster(team_id=team_id, season=season, get_request=False)
+        team_info.nba_response = send_stats_request(team_info)
+        team_info.load_response()
 
         # Extract the data frame containing team information
         dfTeam = team_info.get_data_frames()[0]
@@ -110,6 +751,42 @@ def get_team_info_dataframe(team_id: int, season: str=CURRENT_SEASON) -> pd.Data
         raise ValueError(f"Error retrieving team information: {ve}")
 
 
+async def get_team_info_dataframe_async(team_id: int, season: str=CURRENT_SEASON) -> pd.DataFrame:
+    """Asynchronously get information about an NBA team as a Pandas DataFrame.
+
+    The blocking roster request runs on a worker thread while holding the event loop's fetch semaphore.
+
+    Parameters:
+        team_id (int): The unique identifier of the NBA team.
+        season (str, optional): The season for which the information is desired. Defaults to CURRENT_SEASON.
+
+    Returns:
+        pd.DataFrame: A Pandas DataFrame containing the team's information.
+
+    Raises:
+        ValueError: If the provided team_id is invalid or if no data is available for the specified team and season.
+    """
+    async with get_fetch_semaphore():
+        return await asyncio.to_thread(get_team_info_dataframe, team_id, season)
+
+
+def get_fetch_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent fetches on the running event loop.
+
+    Semaphores are bound to a single event loop, so one is created lazily per loop.
+
+    Returns:
+        asyncio.Semaphore: The running loop's fetch semaphore.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = FETCH_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(ASYNC_FETCH_LIMIT)
+        FETCH_SEMAPHORES[loop] = semaphore
+
+    return semaphore
+
+
 def find_team(team_abr: str=None, team_fullname: str=None, team_nickname: str=None) -> dict:
     """Find information about an NBA team based on various criteria.
 
@@ -118,6 +795,10 @@ def find_team(team_abr: str=None, team_fullname: str=None, team_nickname: str=No
         Full team name (team_fullname)
         Team nickname (team_nickname)
 
+    Every criterion is resolved by the same team index, so any of them also accepts a city or a
+    historical abbreviation or name (e.g. 'SEA' or 'New Jersey Nets'). Misspelled names resolve to
+    the closest match.
+
     Parameters:
         team_abr (str, optional): The abbreviation of the NBA team.
         team_fullname (str, optional): The full name of the NBA team.
@@ -129,27 +810,57 @@ def find_team(team_abr: str=None, team_fullname: str=None, team_nickname: str=No
     Raises:
         SystemExit: If no team information is found based on the provided criteria, the script exits with an error message.
     """
-    team = {}
-
-    if team_abr:  # Find team by abbreviation
-        data = teams.find_team_by_abbreviation(team_abr)
-        team.update(data)
-    elif team_fullname:  # Find team by full name
-        for data in teams.find_teams_by_full_name(team_fullname):
-            team.update(data)
-    elif team_nickname:  # Find team by nickname
-        for data in teams.find_teams_by_nickname(team_nickname):
-            team.update(data)
-    else:  # Exit if no team criteria is provided
+    query = team_abr or team_fullname or team_nickname
+    if not query:  # Exit if no team criteria is provided
         exit("No team submitted. Please try again.")
 
-    # Return the team if found. Else, exit.
+    team = TEAM_INDEX.get(query)
+    if team:
+        return team
+
+    # Exit if the key belongs to several teams (e.g. a city)
+    if TEAM_INDEX.get_all(query):
+        exit("'{}' matches several teams ({}). Please try again.".format(
+            query, ", ".join(data['full_name'] for data in TEAM_INDEX.get_all(query))))
+
+    # Fall back to a fuzzy match (typos), only when it is close and clearly the best
+    team, suggestions = TEAM_SEARCH.resolve(query)
     if team:
+        print("Assuming {} for '{}'.".format(team['full_name'], query))
         return team
+    elif suggestions:
+        exit("Unable to find team '{}'. Did you mean: {}?".format(
+            query, ", ".join(data['full_name'] for _, data in suggestions)))
     else:
         exit("Unable to find team. Please try again.")
 
 
+def suggest_players(query: str, limit: int=5) -> list:
+    """Suggest players whose names best match a partial or misspelled name, e.g. for autocomplete.
+
+    Args:
+        query (str): Partial or misspelled player name.
+        limit (int, optional): Maximum number of suggestions. Defaults to 5.
+
+    Returns:
+        list: Player dictionaries, best match first.
+    """
+    return [player for _, player in PLAYER_SEARCH.search(query, limit=limit)]
+
+
+def suggest_teams(query: str, limit: int=5) -> list:
+    """Suggest teams whose name, nickname, city or (historical) abbreviation best match a query, e.g. for autocomplete.
+
+    Args:
+        query (str): Partial or misspelled team name.
+        limit (int, optional): Maximum number of suggestions. Defaults to 5.
+
+    Returns:
+        list: Team dictionaries, best match first.
+    """
+    return [team for _, team in TEAM_SEARCH.search(query, limit=limit)]
+
+
 def get_game_date() -> str:
     """Get the date of the previous day.
 
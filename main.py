@@ -1,32 +1,63 @@
-# python main.py --player "Player Name" --team_nickname "TeamNickName" --game_date "m/dd/YYYY" --season "XXXX-YY" --plot_type 'shotchart' --shot_points
+# python main.py --player "Player Name" ["Another Player" ...] [--team_nickname "TeamNickName"] --game_date "m/dd/YYYY" [--date_from "m/dd/YYYY" --date_to "m/dd/YYYY"] --season "XXXX-YY" --plot_type 'shotchart' --shot_points
 from classes.shotchart import ShotChart
 from helpers.cli import parse_args
 from helpers.plot_utils import display_shot_data
+from helpers.replay_utils import configure_replay
+from helpers.request_utils import configure_requests
+from helpers.request_utils import dump_latency_histograms
+from helpers.shotchart_utils import fetch_player_shotcharts
+from helpers.shotchart_utils import fetch_processed_shotchart
 from helpers.shotchart_utils import fetch_shotchart_data
 from helpers.shotchart_utils import find_team
-from helpers.shotchart_utils import get_player_info
+from helpers.shotchart_utils import get_team_info_dataframe
 from helpers.shotchart_utils import process_shot_data
+from helpers.shotchart_utils import split_shotchart_by_player
 
 if __name__ == "__main__":
     args = parse_args()
+    configure_replay(args)
+    configure_requests(timeout=args.timeout, retries=args.retries, pool_size=args.pool_size)
 
-    player = get_player_info(args.player) if args.player else 0
-    team = find_team(team_abr=args.team_abr, team_fullname=args.team_fullname, team_nickname=args.team_nickname)
+    # Players may be charted without a team, each across every team they played for
+    team_query = args.team_abr or args.team_fullname or args.team_nickname
+    team = find_team(team_abr=args.team_abr, team_fullname=args.team_fullname, team_nickname=args.team_nickname) \
+        if team_query or not args.player else None
 
-    shotchart_df = fetch_shotchart_data(args.season, args.season_type, args.game_date, team, player)
-    if not shotchart_df.empty:
-        shotchart = ShotChart(shotchart_df=shotchart_df)
+    aggregates = dict(
+        zones=args.zones,
+        points=args.points,
+        shot_type=args.types,
+        shot_distances=args.distances,
+        shot_periods=args.periods
+    )
 
-        shotchart.process(
-            zones=args.zones,
-            points=args.points,
-            shot_type=args.types,
-            shot_distances=args.distances,
-            shot_periods=args.periods
-        )
+    if args.roster:
+        # Chart every player on the roster from the single team-wide frame
+        shotchart_df = fetch_shotchart_data(args.season, args.season_type, args.game_date, team, 0,
+                                            use_cache=args.use_cache, columns=ShotChart.COLUMNS,
+                                            date_from=args.date_from, date_to=args.date_to)
+        roster_df = get_team_info_dataframe(team['id'], args.season, use_cache=args.use_cache)
+        shotcharts = list(split_shotchart_by_player(shotchart_df, roster_df).values())
+    elif args.player:
+        # Resolve and fetch every requested player concurrently, one chart each
+        shotcharts = fetch_player_shotcharts(args.season, args.season_type, args.game_date, team, args.player,
+                                             use_cache=args.use_cache, date_from=args.date_from,
+                                             date_to=args.date_to, **aggregates)
+    else:
+        # Served warm when the prefetch daemon already processed this chart
+        shotcharts = [fetch_processed_shotchart(args.season, args.season_type, args.game_date, team, 0,
+                                                use_cache=args.use_cache, date_from=args.date_from,
+                                                date_to=args.date_to, **aggregates)]
+
+    if shotcharts:
+        for shotchart in shotcharts:
+            shotchart.process(**aggregates)
+
+            # Process and display the shots data based based on cmd args
+            # process_shot_data(shotchart, args)
+            display_shot_data(shotchart, args)
 
-        # Process and display the shots data based based on cmd args
-        # process_shot_data(shotchart, args)
-        display_shot_data(shotchart, args)
+        if args.latency_report:
+            dump_latency_histograms()
     else:
         exit("ERROR: Unable to fetch shotchart data.")
@@ -0,0 +1,16 @@
+# python prefetch.py --season "XXXX-YY" --season_type "Regular Season" [--schedule schedule.csv] [--interval 300] [--once]
+from helpers.cli import parse_prefetch_args
+from helpers.prefetch_utils import run_prefetch_daemon
+from helpers.replay_utils import configure_replay
+from helpers.request_utils import configure_requests
+
+if __name__ == "__main__":
+    args = parse_prefetch_args()
+    configure_replay(args)
+    configure_requests(timeout=args.timeout, retries=args.retries, pool_size=max(args.pool_size, args.workers))
+
+    try:
+        run_prefetch_daemon(args.season, args.season_type, schedule_path=args.schedule, poll_interval=args.interval,
+                            max_workers=args.workers, once=args.once)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,15 @@
+# python stats_server.py --fixtures "path/to/fixtures" --port 8000 --replay_latency 0.2 --replay_error_rate 0.05
+from classes.stats_server import StatsServer
+from helpers.cli import parse_stats_server_args
+
+if __name__ == "__main__":
+    args = parse_stats_server_args()
+
+    server = StatsServer(args.fixtures, port=args.port, latency=args.replay_latency, jitter=args.replay_jitter,
+                         error_rate=args.replay_error_rate, seed=args.replay_seed)
+    print("Serving recorded stats API responses at {}".format(server.base_url))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
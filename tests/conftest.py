@@ -0,0 +1,33 @@
+import os
+import tempfile
+
+# Keep the caches, warehouse and archive the helpers open on import out of the user's data directory
+os.environ["NBA_SHOT_CHARTS_DIR"] = tempfile.mkdtemp(prefix="nba_shot_charts_")
+
+import pytest
+
+SHOTCHART_HEADERS = ["GRID_TYPE", "GAME_ID", "GAME_EVENT_ID", "PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_NAME",
+                     "PERIOD", "MINUTES_REMAINING", "SECONDS_REMAINING", "EVENT_TYPE", "ACTION_TYPE", "SHOT_TYPE",
+                     "SHOT_ZONE_BASIC", "SHOT_ZONE_AREA", "SHOT_ZONE_RANGE", "SHOT_DISTANCE", "LOC_X", "LOC_Y",
+                     "SHOT_ATTEMPTED_FLAG", "SHOT_MADE_FLAG", "GAME_DATE", "HTM", "VTM"]
+
+
+def make_shotchart_payload(games: list, team_id: int=1610612737, shots: int=3) -> dict:
+    """Build a ShotChartDetail payload with a few shots per game.
+
+    Args:
+        games (list): (game_id, 'YYYYMMDD') pairs.
+        team_id (int, optional): The team taking every shot. Defaults to the Hawks.
+        shots (int, optional): Number of shots per game. Defaults to 3.
+    """
+    rows = [["Shot Chart Detail", game_id, event, 201939, "Stephen Curry", team_id, "Atlanta Hawks", 1, 5, 30,
+             "Made Shot", "Jump Shot", "3PT Field Goal", "Above the Break 3", "Center(C)", "24+ ft.", 25, 0, 250, 1, 1,
+             game_date, "ATL", "BOS"]
+            for game_id, game_date in games for event in range(shots)]
+    return {"resultSets": [{"name": "Shot_Chart_Detail", "headers": SHOTCHART_HEADERS, "rowSet": rows}]}
+
+
+@pytest.fixture
+def shotchart_payload():
+    """Factory building ShotChartDetail payloads (see make_shotchart_payload)."""
+    return make_shotchart_payload
@@ -0,0 +1,95 @@
+import json
+from datetime import datetime, timedelta
+import pytest
+import helpers.backfill_utils as backfill_utils
+from classes.shot_warehouse import ShotWarehouse
+from helpers.schema_utils import decode_shotchart_payload
+
+pytest.importorskip("pyarrow")
+
+HAWKS = {'id': 1610612737, 'abbreviation': 'ATL', 'full_name': 'Atlanta Hawks'}
+
+
+def days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime('%Y%m%d')
+
+
+@pytest.fixture
+def warehouse(tmp_path, monkeypatch):
+    warehouse = ShotWarehouse(str(tmp_path))
+    monkeypatch.setattr(backfill_utils, "SHOT_WAREHOUSE", warehouse)
+    return warehouse
+
+
+def serve_shots(monkeypatch, shotchart_payload, games: list):
+    """Answer every ShotChartDetail request with the given games, within the requested window."""
+    def request_shotchart_data(player_id, team_id, season, season_type, date_from=None, date_to=None):
+        start = datetime.strptime(date_from, '%m/%d/%Y').strftime('%Y%m%d')
+        return decode_shotchart_payload(shotchart_payload([game for game in games if game[1] >= start]))
+    monkeypatch.setattr(backfill_utils, "request_shotchart_data", request_shotchart_data)
+
+
+def test_revalidate_without_watermark_never_claims_coverage(warehouse, monkeypatch, shotchart_payload):
+    # Games stored by interactive lookups, with gaps between them and no watermark
+    stored = [("0022000001", days_ago(30)), ("0022000003", days_ago(25))]
+    warehouse.write(decode_shotchart_payload(shotchart_payload(stored)), "2020-21", "Regular Season")
+    serve_shots(monkeypatch, shotchart_payload, stored + [("0022000002", days_ago(28)), ("0022000004", days_ago(15))])
+
+    backfill_utils.revalidate_team("2020-21", "Regular Season", HAWKS, days=20)
+
+    assert warehouse.get_watermark("2020-21", "Regular Season", HAWKS['id']) is None
+    assert not warehouse.covers("2020-21", "Regular Season", HAWKS['id'], days_ago(15))
+    stored_games = set(warehouse.read("2020-21", "Regular Season", team_id=HAWKS['id'])["GAME_ID"])
+    assert stored_games == {"0022000001", "0022000003", "0022000004"}
+
+
+def test_revalidate_past_watermark_keeps_it(warehouse, monkeypatch, shotchart_payload):
+    stored = [("0022000001", days_ago(30))]
+    warehouse.write(decode_shotchart_payload(shotchart_payload(stored)), "2020-21", "Regular Season")
+    warehouse.set_watermark("2020-21", "Regular Season", HAWKS['id'], days_ago(30), "0022000001")
+    serve_shots(monkeypatch, shotchart_payload, stored + [("0022000002", days_ago(25)), ("0022000003", days_ago(15))])
+
+    backfill_utils.revalidate_team("2020-21", "Regular Season", HAWKS, days=20)
+
+    assert warehouse.get_watermark("2020-21", "Regular Season", HAWKS['id'])["GAME_DATE"] == days_ago(30)
+    assert not warehouse.covers("2020-21", "Regular Season", HAWKS['id'], days_ago(15))
+
+
+def test_revalidate_reaching_watermark_advances_it(warehouse, monkeypatch, shotchart_payload):
+    stored = [("0022000001", days_ago(30))]
+    warehouse.write(decode_shotchart_payload(shotchart_payload(stored)), "2020-21", "Regular Season")
+    warehouse.set_watermark("2020-21", "Regular Season", HAWKS['id'], days_ago(30), "0022000001")
+    serve_shots(monkeypatch, shotchart_payload, stored + [("0022000002", days_ago(25)), ("0022000003", days_ago(15))])
+
+    backfill_utils.revalidate_team("2020-21", "Regular Season", HAWKS, days=35)
+
+    assert warehouse.get_watermark("2020-21", "Regular Season", HAWKS['id'])["GAME_DATE"] == days_ago(15)
+    assert warehouse.covers("2020-21", "Regular Season", HAWKS['id'], days_ago(15))
+
+
+class FakeArchive:
+    """Serves archived ShotChartDetail payloads to rebuild_from_archive."""
+    def __init__(self, payload: dict, archived: datetime):
+        self.payload = payload
+        self.archived = archived
+
+    def entries(self, endpoint: str = None) -> list:
+        params = {'PlayerID': 0, 'TeamID': HAWKS['id'], 'Season': "2020-21", 'SeasonType': "Regular Season",
+                  'DateFrom': '', 'DateTo': ''}
+        return [{'params': params, 'digest': "0" * 40, 'archived': self.archived.timestamp()}]
+
+    def get(self, digest: str) -> str:
+        return json.dumps(self.payload)
+
+
+@pytest.mark.parametrize("archived_at, stored", [(23, set()), (24 + 3, set()), (24 + 7, {"0022000001"})])
+def test_rebuild_skips_games_not_final_when_archived(warehouse, monkeypatch, shotchart_payload, archived_at, stored):
+    game_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=10)
+    payload = shotchart_payload([("0022000001", game_day.strftime('%Y%m%d'))])
+    monkeypatch.setattr(backfill_utils, "SHOT_ARCHIVE", FakeArchive(payload, game_day + timedelta(hours=archived_at)))
+    monkeypatch.setattr(backfill_utils.TEAM_INDEX, "get_teams", lambda: [HAWKS])
+
+    backfill_utils.rebuild_from_archive("2020-21", ["Regular Season"])
+
+    assert set(warehouse.read("2020-21", "Regular Season", team_id=HAWKS['id'])["GAME_ID"]) == stored
+    assert bool(warehouse.get_watermark("2020-21", "Regular Season", HAWKS['id'])) == bool(stored)
@@ -0,0 +1,25 @@
+from datetime import datetime, timedelta
+import helpers.shotchart_utils as shotchart_utils
+from classes.league_shot_index import LeagueShotIndex
+from classes.shotchart import ShotChart
+from helpers.prefetch_utils import cache_league_shotcharts
+from helpers.schema_utils import decode_shotchart_payload
+
+HAWKS = {'id': 1610612737, 'abbreviation': 'ATL', 'full_name': 'Atlanta Hawks'}
+
+
+def test_player_lookup_without_team_hits_prefetched_chart(monkeypatch, shotchart_payload):
+    game_date = datetime.now() - timedelta(days=10)
+    shotchart_df = decode_shotchart_payload(shotchart_payload([("0022000001", game_date.strftime('%Y%m%d'))]))
+    cache_league_shotcharts(LeagueShotIndex(shotchart_df[ShotChart.COLUMNS]), "2020-21", "Regular Season",
+                            game_date.strftime('%m/%d/%Y'), [HAWKS])
+
+    def load_shotchart_data(*args, **kwargs):
+        raise AssertionError("prefetched chart missed the cache")
+    monkeypatch.setattr(shotchart_utils, "load_shotchart_data", load_shotchart_data)
+
+    shotcharts = shotchart_utils.fetch_player_shotcharts("2020-21", ["Regular Season"], game_date.strftime('%m/%d/%Y'),
+                                                         None, ["Stephen Curry"])
+
+    assert len(shotcharts) == 1
+    assert len(shotcharts[0].df) == 3
@@ -0,0 +1,28 @@
+import pytest
+from classes.shot_warehouse import ShotWarehouse
+from helpers.schema_utils import decode_shotchart_payload
+
+pytest.importorskip("pyarrow")
+
+
+def test_read_matches_api_frame_schema(tmp_path, shotchart_payload):
+    api_df = decode_shotchart_payload(shotchart_payload([("0022000001", "20210101"), ("0022000002", "20210103")]))
+    warehouse = ShotWarehouse(str(tmp_path))
+    warehouse.write(api_df, "2020-21", "Regular Season")
+
+    stored_df = warehouse.read("2020-21", "Regular Season", team_id=1610612737)
+
+    assert list(stored_df.columns) == list(api_df.columns)
+    assert stored_df.dtypes.astype(str).tolist() == api_df.dtypes.astype(str).tolist()
+    assert len(stored_df) == len(api_df)
+
+
+def test_read_partition_columns_on_request(tmp_path, shotchart_payload):
+    api_df = decode_shotchart_payload(shotchart_payload([("0022000001", "20210101")]))
+    warehouse = ShotWarehouse(str(tmp_path))
+    warehouse.write(api_df, "2020-21", "Regular Season")
+
+    stored_df = warehouse.read("2020-21", "Regular Season", columns=["GAME_ID", "SEASON_TYPE"])
+
+    assert list(stored_df.columns) == ["GAME_ID", "SEASON_TYPE"]
+    assert set(stored_df["SEASON_TYPE"]) == {"Regular Season"}
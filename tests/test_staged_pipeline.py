@@ -0,0 +1,43 @@
+import threading
+from classes.staged_pipeline import StagedPipeline
+
+
+def run_with_timeout(pipeline: StagedPipeline, items: list, timeout: float = 5) -> bool:
+    """Run a pipeline in a thread and report whether it returned in time."""
+    thread = threading.Thread(target=pipeline.run, args=(items,), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_run_returns_when_on_complete_raises():
+    errors = []
+
+    def on_complete(item, payload):
+        raise OSError("journal write failed")
+
+    stages = [("double", lambda item, payload: item * 2, 2), ("write", lambda item, payload: payload, 1)]
+    pipeline = StagedPipeline(stages, queue_size=1, on_complete=on_complete,
+                              on_error=lambda item, stage, e: errors.append((item, stage)))
+
+    assert run_with_timeout(pipeline, list(range(10)))
+    assert sorted(errors) == [(item, "write") for item in range(10)]
+    assert pipeline.stats()[-1]["failed"] == 10
+    assert pipeline.stats()[-1]["processed"] == 0
+
+
+def test_run_returns_when_on_error_raises():
+    def on_error(item, stage, e):
+        raise OSError("journal write failed")
+
+    def fail_odd(item, payload):
+        if item % 2:
+            raise ValueError(item)
+        return item
+
+    completed = []
+    pipeline = StagedPipeline([("fetch", fail_odd, 2), ("write", lambda item, payload: payload, 1)], queue_size=1,
+                              on_complete=lambda item, payload: completed.append(item), on_error=on_error)
+
+    assert run_with_timeout(pipeline, list(range(10)))
+    assert sorted(completed) == [0, 2, 4, 6, 8]